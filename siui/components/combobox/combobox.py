@@ -6,10 +6,12 @@ from siui.components.menu.abstracts.ani_manager import AnimationManager
 from siui.components.menu.menu import SiMenu
 from siui.components.widgets.button import SiSimpleButton
 from siui.components.widgets.label import SiLabel
-from siui.core.color import SiColor
+from siui.core.globals.stylesheet import style_template
 from siui.core.silicon import Si
 from siui.gui.font import GlobalFont, SiFont
 
+_value_label_qss = style_template("color: {TEXT_B}")
+
 
 class SiComboBox(ABCSiComboBox):
     def __init__(self, *args, **kwargs):
@@ -49,7 +51,7 @@ class SiComboBox(ABCSiComboBox):
 
     def reloadStyleSheet(self):
         super().reloadStyleSheet()
-        self.value_label.setStyleSheet(f"color: {self.colorGroup().fromToken(SiColor.TEXT_B)}")
+        self.value_label.setStyleSheet(_value_label_qss.render(self.colorGroup()))
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
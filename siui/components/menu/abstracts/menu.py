@@ -9,8 +9,17 @@ from siui.components.widgets.container import SiDenseVContainer
 from siui.components.widgets.label import SiLabel
 from siui.core.color import SiColor
 from siui.core.globals import SiGlobal
+from siui.core.globals.stylesheet import style_template
 from siui.core.silicon import Si
 
+_body_panel_qss = style_template(
+    "#menu_body_panel {"
+    "    background-color: {MENU_BG};"
+    "    border: 1px solid {border_color};"
+    "    border-radius: 6px"
+    "}"
+)
+
 
 class ABCSiMenu(SiWidget):
     indexChanged = pyqtSignal(int)
@@ -65,13 +74,9 @@ class ABCSiMenu(SiWidget):
 
     def reloadStyleSheet(self):
         super().reloadStyleSheet()
-        self.body_panel.setStyleSheet(
-            f"""#menu_body_panel {{
-                    background-color: {self.colorGroup().fromToken(SiColor.MENU_BG)};
-                    border: 1px solid {SiColor.mix(self.colorGroup().fromToken(SiColor.MENU_BG), self.colorGroup().fromToken(SiColor.TEXT_E), 0.9)};
-                    border-radius: 6px
-            }}"""
-        )
+        border_color = SiColor.mix(self.colorGroup().fromToken(SiColor.MENU_BG),
+                                   self.colorGroup().fromToken(SiColor.TEXT_E), 0.9)
+        self.body_panel.setStyleSheet(_body_panel_qss.render(self.colorGroup(), border_color=border_color))
 
     def setAnchorByIndex(self, index):
         """ set an option's position as the anchor of the menu by index """
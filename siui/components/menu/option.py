@@ -59,6 +59,7 @@ class SiMenuOption(SiDenseHContainer):
         self.icon = SiSvgLabel(self)
         self.icon.resize(32, 32)
         self.icon.setSvgSize(16, 16)
+        self.icon.setRasterized(True)  # 菜单中的图标经常重复，共享栅格化的结果
         if icon is not None:
             self.icon.load(icon)
 
@@ -1,5 +1,9 @@
 from siui.components.widgets import SiDenseHContainer, SiDenseVContainer, SiLabel
 from siui.core.globals.globals import SiGlobal
+from siui.core.globals.stylesheet import style_template
+
+_outfit_lower_qss = style_template("background-color: {INTERFACE_BG_A}")
+_outfit_upper_qss = style_template("background-color: {INTERFACE_BG_C}")
 
 
 class ABCSiOptionCardPlane(SiLabel):
@@ -81,8 +85,8 @@ class ABCSiOptionCardPlane(SiLabel):
     def reloadStyleSheet(self):
         super().reloadStyleSheet()
 
-        self.outfit_label_lower.setStyleSheet("background-color: {}".format(SiGlobal.siui.colors["INTERFACE_BG_A"]))
-        self.outfit_label_upper.setStyleSheet("background-color: {}".format(SiGlobal.siui.colors["INTERFACE_BG_C"]))
+        self.outfit_label_lower.setStyleSheet(_outfit_lower_qss.render(SiGlobal.siui.colors))
+        self.outfit_label_upper.setStyleSheet(_outfit_upper_qss.render(SiGlobal.siui.colors))
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -5,8 +5,11 @@ from siui.components.widgets.abstracts.widget import SiWidget
 from siui.components.widgets.container import SiDenseHContainer
 from siui.components.widgets.label import SiLabel, SiSvgLabel
 from siui.core.globals import SiGlobal
+from siui.core.globals.stylesheet import style_template
 from siui.core.silicon import Si
 
+_title_qss = style_template("color: {TEXT_A}")
+
 
 class SiOptionCardLinear(SiWidget):
     def __init__(self, *args, **kwargs):
@@ -128,7 +131,7 @@ class SiOptionCardPlane(ABCSiOptionCardPlane):
 
     def reloadStyleSheet(self):
         super().reloadStyleSheet()
-        self.title.setStyleSheet("color: {}".format(SiGlobal.siui.colors["TEXT_A"]))
+        self.title.setStyleSheet(_title_qss.render(SiGlobal.siui.colors))
 
     def setTitle(self, text: str):
         """
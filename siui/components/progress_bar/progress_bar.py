@@ -40,6 +40,7 @@ class SiProgressBar(SiLabel):
         # 闪烁层
         self.flash = SiLabel(self.frame)
         self.flash.setFixedHeight(6)
+        self.flash.setColorPainted(True)
         self.flash.animationGroup().fromToken("color").setFactor(1 / 32)
 
         # 轨道高度，这决定了进度条进度显示部分的高度
@@ -164,14 +165,19 @@ class WaveAnimation(ABCSiAnimation):
         self.speed_factor = speed_factor
 
     def _process(self):
+        frames = self._referenceFrames() if self.isTimeBased() else 1
         step_length = self._step_length()
-        self.setCurrent(self.current_ + step_length)
+        self.setCurrent(self.current_ + step_length * frames)
         self.ticked.emit(self.current_ * self.speed_factor)
-        self.t += self.step
+        self.t += self.step * frames
 
     def _step_length(self):
         return (1 - numpy.sin(self.t * self.omiga)) / (2 * self.b) + 0.45
 
+    def finish(self):
+        # 波动动画没有目标值，完成时只停止
+        self.stop()
+
 
 class SiCircularProgressBar(SiLabel):
     def __init__(self, *args, **kwargs):
@@ -237,8 +243,8 @@ class SiCircularProgressBar(SiLabel):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        color_array = SiColor.toArray(self.colorGroup().fromToken(SiColor.PROGRESS_BAR_PROCESSING))[1:4]
-        pen = QPen(QColor(*color_array), self.bar_width)
+        _, r, g, b = SiColor.toTuple(self.colorGroup().fromToken(SiColor.PROGRESS_BAR_PROCESSING))
+        pen = QPen(QColor(r, g, b), self.bar_width)
         pen.setCapStyle(Qt.PenCapStyle.RoundCap)
         painter.setPen(pen)
 
@@ -9,6 +9,7 @@ from siui.core.silicon import Si
 class SiSliderH(QAbstractSlider):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        SiGlobal.siui.registerWidget(self)  # 主题变化时随所在窗口重载样式表
 
         # 设定值对应的颜色
         self.color_low = SiGlobal.siui.colors["THEME_TRANSITION_A"]
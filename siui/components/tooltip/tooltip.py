@@ -60,6 +60,7 @@ class ToolTipWindow(SiWidget):
         self.highlight_mask = SiLabel(self)
         self.highlight_mask.move(self.margin, self.margin)
         self.highlight_mask.setFixedStyleSheet("border-radius: 6px")
+        self.highlight_mask.setColorPainted(True)
         self.highlight_mask.setColor("#00FFFFFF")
 
         # 通过输入空文本初始化大小
@@ -135,6 +136,11 @@ class ToolTipWindow(SiWidget):
         pos = QCursor.pos()
         x, y = pos.x(), pos.y()
         # self.move(x, y)
+        if self.windowOpacity() == 0:
+            # 完全透明时不需要跟踪动画，直接移动
+            self.deactivateMove()
+            self.move(x + 4, y - self.height())
+            return
         self.moveTo(x + 4, y - self.height())    # 动画跟踪，效果更佳，有了锚点直接输入鼠标坐标即可
 
     def resizeEvent(self, event):
@@ -19,6 +19,7 @@ class ABCButton(QPushButton):
     """
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        SiGlobal.siui.registerWidget(self)  # 主题变化时随所在窗口重载样式表
         super().setStyleSheet("background-color: transparent")
 
         self.hint = ""
@@ -32,6 +33,7 @@ class ABCButton(QPushButton):
         # 提供悬停时的颜色变化动画
         self.hover_highlight = SiLabel(self)
         self.hover_highlight.stackUnder(self)  # 置于按钮的底部
+        self.hover_highlight.setColorPainted(True)  # 悬停时频繁变色，直接绘制颜色
         self.hover_highlight.setColor(SiColor.trans(self.colorGroup().fromToken(SiColor.BUTTON_HOVER), 0.0))
         self.hover_highlight.animationGroup().fromToken("color").setBias(0.2)
         self.hover_highlight.animationGroup().fromToken("color").setFactor(1 / 8)
@@ -39,6 +41,7 @@ class ABCButton(QPushButton):
         # 提供点击时的颜色变化动画
         self.flash_label = SiLabel(self)
         self.flash_label.stackUnder(self)  # 置于按钮的底部
+        self.flash_label.setColorPainted(True)
         self.flash_label.setColor(SiColor.trans(self.colorGroup().fromToken(SiColor.BUTTON_FLASH), 0.0))
         self.flash_label.animationGroup().fromToken("color").setBias(0.2)
         self.flash_label.animationGroup().fromToken("color").setFactor(1 / 8)
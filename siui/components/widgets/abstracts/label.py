@@ -1,11 +1,12 @@
-
+import numpy
 from PyQt5.QtCore import QPoint, pyqtSignal, QSize
 from PyQt5.QtWidgets import QGraphicsOpacityEffect, QLabel
 
-from siui.core.animation import SiAnimationGroup, SiExpAnimation
+from siui.core.animation import SiAnimationGroup, SiExpAnimation, SiVisibilityPolicy
 from siui.core.color import SiColor
-from siui.core.effect import SiQuickEffect
+from siui.core.effect import SiColorFill, SiQuickEffect
 from siui.core.globals import SiGlobal
+from siui.core.globals.stylesheet import flush_style_sheet, pending_style_sheet, set_style_sheet
 from siui.core.silicon import Si
 from siui.gui.color_group import SiColorGroup
 
@@ -18,6 +19,7 @@ class ABCAnimatedLabel(QLabel):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        SiGlobal.siui.registerWidget(self)  # 主题变化时随所在窗口重载样式表
 
         self.hint = ""
         self.fixed_stylesheet = ""
@@ -29,48 +31,115 @@ class ABCAnimatedLabel(QLabel):
         self.x1, self.y1, self.x2, self.y2 = None, None, None, None
         self.move_anchor = QPoint(0, 0)  # 移动时的基准点位置
 
-        self.animation_move = SiExpAnimation(self)
-        self.animation_move.setFactor(1/4)
-        self.animation_move.setBias(1)
-        self.animation_move.setCurrent([0, 0])
-        self.animation_move.setTarget([0, 0])
-        self.animation_move.ticked.connect(self._move_ani_handler)
-
-        self.animation_resize = SiExpAnimation(self)
-        self.animation_resize.setFactor(1/4)
-        self.animation_resize.setBias(1)
-        self.animation_resize.setCurrent([0, 0])
-        self.animation_resize.setTarget([0, 0])
-        self.animation_resize.ticked.connect(self._resize_ani_handler)
-
-        self.animation_opacity = SiExpAnimation(self)
-        self.animation_opacity.setFactor(1/4)
-        self.animation_opacity.setBias(0.01)
-        self.animation_opacity.ticked.connect(self._opacity_ani_handler)
-
-        self.animation_color = SiExpAnimation(self)
-        self.animation_color.setFactor(1/4)
-        self.animation_color.setBias(1)
-        self.animation_color.ticked.connect(self._set_color_handler)
-
-        self.animation_text_color = SiExpAnimation(self)
-        self.animation_text_color.setFactor(1/4)
-        self.animation_text_color.setBias(1)
-        self.animation_text_color.ticked.connect(self._set_text_color_handler)
-
-        # 创建动画组，以tokenize以上动画
+        self.opacity_ = 0                   # 透明度动画尚未创建时记录的透明度
+        self.color_value_ = 0               # 颜色动画尚未创建时记录的颜色
+        self.text_color_value_ = 0          # 文字颜色动画尚未创建时记录的颜色
+        self.color_fill_ = None             # 不为 None 时，背景颜色在 paintEvent 中绘制
+
+        # 创建动画组，以tokenize以下动画
+        # 动画在第一次被访问时才会被创建，大多数标签从不使用其中的全部动画
         self.animation_group = SiAnimationGroup()
-        self.animation_group.addMember(self.animation_move, token="move")
-        self.animation_group.addMember(self.animation_resize, token="resize")
-        self.animation_group.addMember(self.animation_opacity, token="opacity")
-        self.animation_group.addMember(self.animation_color, token="color")
-        self.animation_group.addMember(self.animation_text_color, token="text_color")
+        self.animation_group.addLazyMember(self._create_move_animation, token="move")
+        self.animation_group.addLazyMember(self._create_resize_animation, token="resize")
+        self.animation_group.addLazyMember(self._create_opacity_animation, token="opacity")
+        self.animation_group.addLazyMember(self._create_color_animation, token="color")
+        self.animation_group.addLazyMember(self._create_text_color_animation, token="text_color")
+
+    def _create_move_animation(self):
+        animation = SiExpAnimation(self)
+        animation.setVisibilityPolicy(SiVisibilityPolicy.Finish)  # 不可见时无需播放过程，直接到达目标
+        animation.setFactor(1/4)
+        animation.setBias(1)
+        animation.setCurrent([self.x() + self.move_anchor.x(), self.y() + self.move_anchor.y()])
+        animation.setTarget([0, 0])
+        animation.ticked.connect(self._move_ani_handler)
+        return animation
+
+    def _create_resize_animation(self):
+        animation = SiExpAnimation(self)
+        animation.setVisibilityPolicy(SiVisibilityPolicy.Finish)  # 不可见时无需播放过程，直接到达目标
+        animation.setFactor(1/4)
+        animation.setBias(1)
+        animation.setCurrent([self.width(), self.height()])
+        animation.setTarget([0, 0])
+        animation.ticked.connect(self._resize_ani_handler)
+        return animation
+
+    def _create_opacity_animation(self):
+        animation = SiExpAnimation(self)
+        animation.setFactor(1/4)
+        animation.setBias(0.01)
+        animation.setCurrent(self.opacity_)
+        animation.ticked.connect(self._opacity_ani_handler)
+        return animation
+
+    def _create_color_animation(self):
+        animation = SiExpAnimation(self)
+        animation.setVisibilityPolicy(SiVisibilityPolicy.Finish)  # 不可见时无需播放过程，直接到达目标
+        animation.setFactor(1/4)
+        animation.setBias(1)
+        animation.setCurrent(self.color_value_)
+        animation.ticked.connect(self._set_color_handler)
+        return animation
+
+    def _create_text_color_animation(self):
+        animation = SiExpAnimation(self)
+        animation.setVisibilityPolicy(SiVisibilityPolicy.Finish)  # 不可见时无需播放过程，直接到达目标
+        animation.setFactor(1/4)
+        animation.setBias(1)
+        animation.setCurrent(self.text_color_value_)
+        animation.ticked.connect(self._set_text_color_handler)
+        return animation
+
+    @property
+    def animation_move(self):
+        return self.animation_group.fromToken("move")
+
+    @property
+    def animation_resize(self):
+        return self.animation_group.fromToken("resize")
+
+    @property
+    def animation_opacity(self):
+        return self.animation_group.fromToken("opacity")
+
+    @property
+    def animation_color(self):
+        return self.animation_group.fromToken("color")
+
+    @property
+    def animation_text_color(self):
+        return self.animation_group.fromToken("text_color")
 
     def setStyleSheet(self, stylesheet: str):
+        # 在 batch_style_sheets() 中时，样式表在批处理结束时才被应用，期间多次设置只会应用最后一次
         if self.fixed_stylesheet == "":
-            super().setStyleSheet(stylesheet)
+            set_style_sheet(self, stylesheet)
         else:
-            super().setStyleSheet(self.fixed_stylesheet + ";" + stylesheet)
+            set_style_sheet(self, self.fixed_stylesheet + ";" + stylesheet)
+
+    def styleSheet(self):
+        stylesheet = pending_style_sheet(self)
+        return super().styleSheet() if stylesheet is None else stylesheet
+
+    def flushStyleSheet(self):
+        """
+        Apply the style sheet waiting in a batch immediately.
+        sizeHint and adjustSize call it, call it before reading other values that depend on the style sheet
+        """
+        flush_style_sheet(self)
+
+    def sizeHint(self):
+        self.flushStyleSheet()
+        return super().sizeHint()
+
+    def minimumSizeHint(self):
+        self.flushStyleSheet()
+        return super().minimumSizeHint()
+
+    def adjustSize(self):
+        self.flushStyleSheet()  # 尺寸取决于样式表
+        super().adjustSize()
 
     def reloadStyleSheet(self):
         """
@@ -123,6 +192,50 @@ class ABCAnimatedLabel(QLabel):
         """
         self.fixed_stylesheet = fixed_stylesheet
         self.setStyleSheet(fixed_stylesheet)
+        self.flushStyleSheet()  # 固定样式表可能影响控件尺寸，立即应用
+        if self.color_fill_ is not None:
+            self.color_fill_.loadBorderRadius(fixed_stylesheet)
+            self.update()
+
+    def setColorPainted(self, on: bool):
+        """
+        Set whether the background color is painted in paintEvent instead of set by style sheet.\n
+        When it is on, color animations only trigger repaints, the border radius is read from the fixed style sheet,
+        and the style sheet is left as the fixed one.
+        :param on: paint the background color or not
+        """
+        if on == self.isColorPainted():
+            return
+
+        if self.animation_group.isCreated("color"):
+            color_value = self.animation_color.current()
+        else:
+            color_value = self.color_value_
+
+        if on is True:
+            self.color_fill_ = SiColorFill()
+            self.color_fill_.loadBorderRadius(self.fixed_stylesheet)
+            self.setStyleSheet("")
+        else:
+            self.color_fill_ = None
+
+        if numpy.ndim(color_value) == 1:  # 颜色为 (A, R, G, B)，尚未设置过颜色时为 0
+            self._set_color_handler(color_value)
+        self.update()
+
+    def isColorPainted(self):
+        """
+        To check whether the background color is painted in paintEvent
+        :return: bool
+        """
+        return self.color_fill_ is not None
+
+    def colorFill(self):
+        """
+        Get the background fill which is painted when setColorPainted is on
+        :return: SiColorFill or None
+        """
+        return self.color_fill_
 
     def _move_ani_handler(self, arr):
         x, y = arr
@@ -136,11 +249,20 @@ class ABCAnimatedLabel(QLabel):
         self.setOpacity(opacity)
 
     def _set_color_handler(self, color_value):
+        if self.color_fill_ is not None:
+            self.color_fill_.setColorValue(color_value)
+            self.update()
+            return
         self.setStyleSheet(f"background-color: {SiColor.toCode(color_value)}")
 
     def _set_text_color_handler(self, color_value):
         self.setStyleSheet(f"color: {SiColor.toCode(color_value)}")
 
+    def paintEvent(self, event):
+        if self.color_fill_ is not None:
+            self.color_fill_.paint(self)
+        super().paintEvent(event)
+
     def setMoveLimits(self,
                       x1: int,
                       y1: int,
@@ -172,7 +294,10 @@ class ABCAnimatedLabel(QLabel):
     def setColor(self, color_code):
         """ Set label background color """
         color_value = SiColor.toArray(color_code)
-        self.animation_color.setCurrent(color_value)
+        if self.animation_group.isCreated("color"):
+            self.animation_color.setCurrent(color_value)
+        else:
+            self.color_value_ = color_value
         self._set_color_handler(color_value)
 
     def setColorTo(self, color_code):
@@ -183,7 +308,10 @@ class ABCAnimatedLabel(QLabel):
     def setTextColor(self, color_code):
         """ Set label text color """
         color_value = SiColor.toArray(color_code)
-        self.animation_text_color.setCurrent(color_value)
+        if self.animation_group.isCreated("text_color"):
+            self.animation_text_color.setCurrent(color_value)
+        else:
+            self.text_color_value_ = color_value
         self._set_text_color_handler(color_value)
 
     def setTextColorTo(self, color_code):
@@ -197,7 +325,10 @@ class ABCAnimatedLabel(QLabel):
         :param opacity: Transparency value 0-1
         :return:
         """
-        self.animation_opacity.setCurrent(opacity)
+        if self.animation_group.isCreated("opacity"):
+            self.animation_opacity.setCurrent(opacity)
+        else:
+            self.opacity_ = opacity
         SiQuickEffect.applyOpacityOn(self, opacity)
 
         if opacity == 0:
@@ -225,28 +356,31 @@ class ABCAnimatedLabel(QLabel):
         self.animation_opacity.try_to_start()
 
     def deactivateSetOpacity(self):
-        self.animation_opacity.stop()
+        if self.animation_group.isCreated("opacity"):
+            self.animation_opacity.stop()
 
     def isSetOpacityActive(self):
-        return self.animation_opacity.isActive()
+        return self.animation_group.isCreated("opacity") and self.animation_opacity.isActive()
 
     def activateMove(self):
         self.animation_move.try_to_start()
 
     def deactivateMove(self):
-        self.animation_move.stop()
+        if self.animation_group.isCreated("move"):
+            self.animation_move.stop()
 
     def isMoveActive(self):
-        return self.animation_move.isActive()
+        return self.animation_group.isCreated("move") and self.animation_move.isActive()
 
     def activateResize(self):
         self.animation_resize.try_to_start()
 
     def deactivateResize(self):
-        self.animation_resize.stop()
+        if self.animation_group.isCreated("resize"):
+            self.animation_resize.stop()
 
     def isResizeActive(self):
-        return self.animation_resize.isActive()
+        return self.animation_group.isCreated("resize") and self.animation_resize.isActive()
 
     def setMoveAnchor(self, x, y):
         self.move_anchor = QPoint(x, y)
@@ -273,7 +407,8 @@ class ABCAnimatedLabel(QLabel):
         # 并且会立即调用动画的 setCurrent 方法，设置动画开始值为 event 中的 pos()
         super().moveEvent(event)
         pos = event.pos() + self.move_anchor
-        self.animation_move.setCurrent([pos.x(), pos.y()])
+        if self.animation_group.isCreated("move"):
+            self.animation_move.setCurrent([pos.x(), pos.y()])
 
         if self.isSiliconWidgetFlagOn(Si.EnableAnimationSignals):
             self.moved.emit([event.pos().x(), event.pos().y()])
@@ -292,7 +427,8 @@ class ABCAnimatedLabel(QLabel):
         super().resizeEvent(event)
         size = event.size()
         w, h = size.width(), size.height()
-        self.animation_resize.setCurrent([w, h])
+        if self.animation_group.isCreated("resize"):
+            self.animation_resize.setCurrent([w, h])
         if self.isSiliconWidgetFlagOn(Si.EnableAnimationSignals):
             self.resized.emit([w, h])
 
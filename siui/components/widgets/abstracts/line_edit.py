@@ -13,6 +13,7 @@ class SiSimpleLineEdit(QLineEdit):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        SiGlobal.siui.registerWidget(self)  # 主题变化时随所在窗口重载样式表
 
         # 设置字体
         self.setFont(SiGlobal.siui.fonts["S_NORMAL"])
@@ -6,10 +6,37 @@ from siui.components.widgets.label import SiIconLabel, SiLabel, SiSvgLabel
 from siui.core.animation import SiExpAnimation
 from siui.core.color import SiColor
 from siui.core.globals import SiGlobal
+from siui.core.globals.stylesheet import style_template
 from siui.core.silicon import Si
 from siui.gui.color_group import SiColorGroup
 from siui.gui.font import GlobalFont, SiFont
 
+# 按钮的样式表模板，同类按钮在同一配色下共享同一个样式表
+_text_qss = style_template("color: {TEXT_B}")
+_push_top_qss = style_template("background-color: {BUTTON_PANEL}")
+_push_bottom_qss = style_template("background-color: {BUTTON_SHADOW}")
+_push_top_transition_qss = style_template(
+    "background-color: qlineargradient(x1:0, y1:0, x2:1, y2:1, "
+    "stop:0 {BUTTON_THEMED_BG_A}, stop:1 {BUTTON_THEMED_BG_B})"
+)
+_push_bottom_transition_qss = style_template(
+    "background-color: qlineargradient(x1:0, y1:0, x2:1, y2:1, "
+    "stop:0 {BUTTON_THEMED_SHADOW_A}, stop:1 {BUTTON_THEMED_SHADOW_B})"
+)
+_long_press_top_qss = style_template("background-color: {BUTTON_LONG_PRESS_PANEL}")
+_long_press_bottom_qss = style_template("background-color: {BUTTON_LONG_PRESS_SHADOW}")
+_radio_checked_qss = style_template("border: 4px solid {RADIO_BUTTON_CHECKED}")
+_radio_unchecked_qss = style_template("border: 3px solid {RADIO_BUTTON_UNCHECKED}")
+_checkbox_checked_qss = style_template("background-color: {CHECKBOX_CHECKED}")
+_checkbox_unchecked_qss = style_template("border: 1px solid {CHECKBOX_UNCHECKED}")
+_switch_frame_on_qss = style_template(
+    "background-color: qlineargradient(x1:0, y1:0, x2:1, y2:1, "
+    "stop:0 {THEME_TRANSITION_A}, stop:1 {THEME_TRANSITION_B});"
+)
+_switch_frame_off_qss = style_template("border: 1px solid {SWITCH_DEACTIVATE}")
+_switch_lever_on_qss = style_template("background-color:{SWITCH_ACTIVATE}")
+_switch_lever_off_qss = style_template("background-color:{SWITCH_DEACTIVATE}")
+
 
 class SiPushButton(ABCPushButton):
     """
@@ -38,30 +65,18 @@ class SiPushButton(ABCPushButton):
         super().reloadStyleSheet()
 
         # 设置文字颜色
-        self.label.setStyleSheet(f"color: {SiGlobal.siui.colors['TEXT_B']}")
+        self.label.setStyleSheet(_text_qss.render(SiGlobal.siui.colors))
 
         # 设置按钮表面和阴影的颜色
         if self.use_transition is True:
             # 使用过渡色
-            self.body_top.setStyleSheet(
-                f"""
-                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {self.colorGroup().fromToken(SiColor.BUTTON_THEMED_BG_A)},
-                    stop:1 {self.colorGroup().fromToken(SiColor.BUTTON_THEMED_BG_B)})
-                """
-            )
-            self.body_bottom.setStyleSheet(
-                f"""
-                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {self.colorGroup().fromToken(SiColor.BUTTON_THEMED_SHADOW_A)},
-                    stop:1 {self.colorGroup().fromToken(SiColor.BUTTON_THEMED_SHADOW_B)})
-                """
-            )
+            self.body_top.setStyleSheet(_push_top_transition_qss.render(self.colorGroup()))
+            self.body_bottom.setStyleSheet(_push_bottom_transition_qss.render(self.colorGroup()))
 
         else:
             # 纯色
-            self.body_top.setStyleSheet(f"background-color: {self.colorGroup().fromToken(SiColor.BUTTON_PANEL)}")
-            self.body_bottom.setStyleSheet(f"background-color: {self.colorGroup().fromToken(SiColor.BUTTON_SHADOW)}")
+            self.body_top.setStyleSheet(_push_top_qss.render(self.colorGroup()))
+            self.body_bottom.setStyleSheet(_push_bottom_qss.render(self.colorGroup()))
 
     def setUseTransition(self, b: bool):
         """
@@ -122,10 +137,10 @@ class SiLongPressButton(ABCPushButton):
         super().reloadStyleSheet()
 
         # 设置文字颜色
-        self.label.setStyleSheet(f"color: {self.colorGroup().fromToken(SiColor.TEXT_B)}")
+        self.label.setStyleSheet(_text_qss.render(self.colorGroup()))
 
-        self.body_top.setStyleSheet(f"background-color: {self.colorGroup().fromToken(SiColor.BUTTON_LONG_PRESS_PANEL)}")
-        self.body_bottom.setStyleSheet(f"background-color: {self.colorGroup().fromToken(SiColor.BUTTON_LONG_PRESS_SHADOW)}")  # noqa: E501
+        self.body_top.setStyleSheet(_long_press_top_qss.render(self.colorGroup()))
+        self.body_bottom.setStyleSheet(_long_press_bottom_qss.render(self.colorGroup()))
 
     def mousePressEvent(self, event):
         super().mousePressEvent(event)
@@ -168,7 +183,7 @@ class SiToggleButton(ABCToggleButton):
     def reloadStyleSheet(self):
         super().reloadStyleSheet()
 
-        self.label.setStyleSheet(f"color: {self.colorGroup().fromToken(SiColor.TEXT_B)}")
+        self.label.setStyleSheet(_text_qss.render(self.colorGroup()))
 
 
 class SiSimpleButton(SiToggleButton):
@@ -221,7 +236,7 @@ class SiRadioButton(SiLabel):
         super().reloadStyleSheet()
 
         # 设置文字颜色
-        self.text_label.setStyleSheet(f"color: {self.colorGroup().fromToken(SiColor.TEXT_B)}")
+        self.text_label.setStyleSheet(_text_qss.render(self.colorGroup()))
 
         # 设置选项按钮样式表，调用自己的事件处理器以刷新
         self._toggled_handler(self.isChecked())
@@ -268,11 +283,11 @@ class SiRadioButton(SiLabel):
 
             # 禁止其切换模式，防止被取消选择
             self.indicator.setCheckable(False)
-            self.indicator_label.setStyleSheet(f"border: 4px solid {self.colorGroup().fromToken(SiColor.RADIO_BUTTON_CHECKED)}")  # noqa: E501
+            self.indicator_label.setStyleSheet(_radio_checked_qss.render(self.colorGroup()))
         else:
             # 如果被选中状态为假，就允许其切换模式
             self.indicator.setCheckable(True)
-            self.indicator_label.setStyleSheet(f"border: 3px solid {self.colorGroup().fromToken(SiColor.RADIO_BUTTON_UNCHECKED)}")  # noqa: E501
+            self.indicator_label.setStyleSheet(_radio_unchecked_qss.render(self.colorGroup()))
 
     def _uncheck_all_in_same_parent(self):
         """
@@ -341,7 +356,7 @@ class SiCheckBox(SiLabel):
         super().reloadStyleSheet()
 
         # 设置文字颜色
-        self.text_label.setStyleSheet(f"color: {self.colorGroup().fromToken(SiColor.TEXT_B)}")
+        self.text_label.setStyleSheet(_text_qss.render(self.colorGroup()))
 
         # 设置选项按钮样式表，调用自己的事件处理器以刷新
         self._toggled_handler(self.isChecked())
@@ -383,10 +398,10 @@ class SiCheckBox(SiLabel):
     def _toggled_handler(self, check: bool):
         if check is True:
             self.indicator_icon.setVisible(True)
-            self.indicator_label.setStyleSheet(f"background-color: {self.colorGroup().fromToken(SiColor.CHECKBOX_CHECKED)}")  # noqa: E501
+            self.indicator_label.setStyleSheet(_checkbox_checked_qss.render(self.colorGroup()))
         else:
             self.indicator_icon.setVisible(False)
-            self.indicator_label.setStyleSheet(f"border: 1px solid {self.colorGroup().fromToken(SiColor.CHECKBOX_UNCHECKED)}")  # noqa: E501
+            self.indicator_label.setStyleSheet(_checkbox_unchecked_qss.render(self.colorGroup()))
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -408,6 +423,7 @@ class SiSwitch(QAbstractButton):
     """
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        SiGlobal.siui.registerWidget(self)  # 主题变化时随所在窗口重载样式表
         self.setCheckable(True)
 
         # 颜色组
@@ -455,18 +471,12 @@ class SiSwitch(QAbstractButton):
 
         # 检测拉杆的位置，如果过了半程，则改变边框样式
         if (x - 3) / 20 >= 0.5:
-            self.switch_frame.setStyleSheet(
-                f"""
-                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 {self.colorGroup().fromToken(SiColor.THEME_TRANSITION_A)},
-                stop:1 {self.colorGroup().fromToken(SiColor.THEME_TRANSITION_B)});
-                """
-            )
-            self.switch_lever.setStyleSheet(f"background-color:{self.colorGroup().fromToken(SiColor.SWITCH_ACTIVATE)}")
+            self.switch_frame.setStyleSheet(_switch_frame_on_qss.render(self.colorGroup()))
+            self.switch_lever.setStyleSheet(_switch_lever_on_qss.render(self.colorGroup()))
 
         else:
-            self.switch_frame.setStyleSheet(f"border: 1px solid {self.colorGroup().fromToken(SiColor.SWITCH_DEACTIVATE)}")  # noqa: E501
-            self.switch_lever.setStyleSheet(f"background-color:{self.colorGroup().fromToken(SiColor.SWITCH_DEACTIVATE)}")  # noqa: E501
+            self.switch_frame.setStyleSheet(_switch_frame_off_qss.render(self.colorGroup()))
+            self.switch_lever.setStyleSheet(_switch_lever_off_qss.render(self.colorGroup()))
 
     def _set_animation_target(self, is_checked):
         if is_checked is True:
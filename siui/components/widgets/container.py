@@ -650,6 +650,7 @@ class ABCSiFlowContainer(SiWidget):
                     delete_timer.singleShot(fade_out_delay + 100, widget.deleteLater)
             else:
                 if delete_later:
+                    widget.animationGroup().stopAll()
                     widget.deleteLater()
 
         elif has_existence_check:
@@ -709,8 +710,7 @@ class ABCSiFlowContainer(SiWidget):
             if widget == dragged_widget:
                 continue
 
-            if (widget.geometry().contains(center_point) and
-                    (widget.animationGroup().fromToken("move").isActive() is False)):
+            if widget.geometry().contains(center_point) and (widget.isMoveActive() is False):
                 # insert dragged widget to where this widget is.
                 self.insertToByIndex(self.widgets().index(dragged_widget),
                                      self.widgets().index(widget),
@@ -785,7 +785,7 @@ class SiFlowContainer(ABCSiFlowContainer):
             # if we needn't perform animations...
             if (ani is False) or (widget in no_ani_exceptions):
                 if (widget in no_arrange_exceptions) is False:
-                    widget.animationGroup().fromToken("move").stop()
+                    widget.deactivateMove()
                     widget.move(used_width, used_height)
 
             # perform animations
@@ -839,7 +839,7 @@ class SiMasonryContainer(ABCSiFlowContainer):
                         [column_index * (self.column_width + self.spacing[0]), used_height[column_index]])
                     widget.animationGroup().fromToken("move").start()
                 else:
-                    widget.animationGroup().fromToken("move").stop()
+                    widget.deactivateMove()
                     widget.move(column_index * (self.column_width + self.spacing[0]), used_height[column_index])
 
             used_height[column_index] += widget.height() + self.spacing[1]
@@ -1,4 +1,4 @@
-from PyQt5.QtCore import QPoint, Qt, pyqtSignal
+from PyQt5.QtCore import QByteArray, QPoint, QRectF, Qt, pyqtSignal
 from PyQt5.QtGui import QPainter, QPainterPath, QPixmap
 from PyQt5.QtSvg import QSvgWidget
 
@@ -6,6 +6,8 @@ from siui.components.widgets.abstracts.label import ABCAnimatedLabel
 from siui.core.alignment.manager import SiQuickAlignmentManager
 from siui.core.globals.globals import SiGlobal
 from siui.core.silicon import Si
+from siui.gui.icons.raster import get_icon_raster_cache
+from siui.gui.icons.renderer import get_svg_renderer_pool
 
 
 class SiLabel(ABCAnimatedLabel):
@@ -80,6 +82,9 @@ class SiSvgLabel(SiLabel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        self.svg_data = None        # 最后一次加载的 SVG
+        self.rasterized = False     # 是否从共享的栅格化缓存绘制，而不是使用自己的 QSvgWidget
+
         # 创建 QSvgWidget
         self.svg_widget = QSvgWidget(self)
         self.setSvgSize(20, 20)
@@ -91,7 +96,34 @@ class SiSvgLabel(SiLabel):
         :param path_or_data: File path or SVG string
         :return:
         """
-        self.svg_widget.load(path_or_data)
+        if isinstance(path_or_data, QByteArray):
+            path_or_data = bytes(path_or_data)
+        self.svg_data = path_or_data
+
+        if self.rasterized:
+            self.update()
+        else:
+            self.svg_widget.load(path_or_data)
+
+    def setRasterized(self, state: bool):
+        """
+        Set whether to draw the icon from the process-wide raster cache instead of an own QSvgWidget.
+        Identical icons of the same size are then rendered only once, and drawn as pixmaps
+        :param state: bool
+        """
+        if state == self.rasterized:
+            return
+
+        self.rasterized = state
+        self.svg_widget.setVisible(not state)
+        if state is True:
+            self.svg_widget.load(QByteArray())  # 释放已经解析的文档
+        elif self.svg_data is not None:
+            self.svg_widget.load(self.svg_data)
+        self.update()
+
+    def isRasterized(self):
+        return self.rasterized
 
     def setSvgSize(self, w, h):
         """
@@ -110,6 +142,68 @@ class SiSvgLabel(SiLabel):
         # 保证居中显示
         self.svg_widget.move((w - self.svg_widget.width()) // 2, (h - self.svg_widget.height()) // 2)
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.rasterized is False or self.svg_data is None:
+            return
+
+        size = self.svg_widget.size()
+        pixmap = get_icon_raster_cache().pixmap(self.svg_data, size.width(), size.height(), self.devicePixelRatioF())
+        painter = QPainter(self)
+        painter.drawPixmap(self.svg_widget.pos(), pixmap)
+        painter.end()
+
+
+class SiSvgPaintLabel(SiLabel):
+    """
+    SiLabel that draws Svg images in paintEvent, through renderers shared by all the labels showing the same Svg.
+    It has the same interface as SiSvgLabel, but no QSvgWidget is created and identical Svg sources are parsed once
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.renderer_ = None   # 共享的 QSvgRenderer，加载前为 None
+        self.svg_size = (20, 20)
+        self.resize(24, 24)
+
+    def load(self, path_or_data):
+        """
+        Load SVG data from string or file
+        :param path_or_data: File path or SVG string
+        """
+        if isinstance(path_or_data, QByteArray):
+            path_or_data = bytes(path_or_data)
+        self.renderer_ = get_svg_renderer_pool().renderer(path_or_data)
+        self.update()
+
+    def renderer(self):
+        """
+        Get the shared renderer in use, don't load anything into it
+        :return: QSvgRenderer or None
+        """
+        return self.renderer_
+
+    def setSvgSize(self, w, h):
+        """
+        Set the size of the SVG icon
+        :param w: int
+        :param h: int
+        """
+        self.svg_size = (w, h)
+        self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.renderer_ is None:
+            return
+
+        # 保证居中显示，与 SiSvgLabel 的位置相同
+        w, h = self.svg_size
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        self.renderer_.render(painter, QRectF((self.width() - w) // 2, (self.height() - h) // 2, w, h))
+        painter.end()
+
 
 class SiIconLabel(SiLabel):
     """
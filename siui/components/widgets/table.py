@@ -1,9 +1,14 @@
 from siui.components import SiLabel, SiMasonryContainer, SiScrollArea, SiWidget
 from siui.components.widgets.abstracts.table import ABCSiTabelManager, ABCSiTable, SiRow
 from siui.core.color import SiColor
+from siui.core.globals.stylesheet import style_template
 from siui.core.silicon import Si
 from siui.gui import GlobalFont, SiFont
 
+_panel_qss = style_template("border: 1px solid {INTERFACE_BG_D};background-color: {INTERFACE_BG_B};")
+_header_panel_qss = style_template("background-color: {INTERFACE_BG_D};")
+_indicator_track_qss = style_template("background-color: {THEME}")
+
 
 class SiTableValueManagerLabels(ABCSiTabelManager):
     def _value_read_parser(self, row_index, col_index):
@@ -92,18 +97,9 @@ class SiTableView(ABCSiTable):
     def reloadStyleSheet(self):
         super().reloadStyleSheet()
 
-        self.panel.setStyleSheet(
-            f"border: 1px solid {self.colorGroup().fromToken(SiColor.INTERFACE_BG_D)};"
-            f"background-color: {self.colorGroup().fromToken(SiColor.INTERFACE_BG_B)};"
-        )
-
-        self.header_panel.setStyleSheet(
-            f"background-color: {self.colorGroup().fromToken(SiColor.INTERFACE_BG_D)};"
-        )
-
-        self.indicator_track.setStyleSheet(
-            f"background-color: {self.colorGroup().fromToken(SiColor.THEME)}"
-        )
+        self.panel.setStyleSheet(_panel_qss.render(self.colorGroup()))
+        self.header_panel.setStyleSheet(_header_panel_qss.render(self.colorGroup()))
+        self.indicator_track.setStyleSheet(_indicator_track_qss.render(self.colorGroup()))
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
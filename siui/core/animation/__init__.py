@@ -1,5 +1,20 @@
 from siui.core.animation import abstract
-from siui.core.animation.animation import SiCounterAnimation, SiExpAccelerateAnimation, SiExpAnimation  # noqa: F401
+from siui.core.animation.animation import (  # noqa: F401
+    SiCounterAnimation,
+    SiExpAccelerateAnimation,
+    SiExpAnimation,
+    SiSpringAnimation,
+)
+from siui.core.animation.clock import (  # noqa: F401
+    SiAnimationClock,
+    SiManualClockBackend,
+    SiTimerClockBackend,
+    SiVisibilityPolicy,
+    get_clock,
+    get_clock_backend,
+    set_clock_backend,
+)
+from siui.core.animation.curve import Curve, SiCurve  # noqa: F401
 from siui.core.animation.group import SiAnimationGroup  # noqa: F401
 
 
@@ -17,3 +32,19 @@ def get_global_fps():
     返回全局动画帧率
     """
     return abstract.global_fps
+
+
+def set_time_based(on):
+    """
+    设置动画是否默认按实际经过的时间推进
+    :param on: if True, animations converge in wall-clock time regardless of dropped frames
+    :return:
+    """
+    abstract.time_based = on
+
+
+def is_time_based():
+    """
+    返回动画是否默认按实际经过的时间推进
+    """
+    return abstract.time_based
@@ -1,13 +1,45 @@
 
 import numpy
-from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtCore import QEvent, QObject, pyqtSignal
+
+from .clock import SiVisibilityPolicy, get_clock
+from .curve import Curve  # noqa: F401  Curve 曾经定义在本模块中，保留以兼容旧的导入
 
 global_fps = 60
+reference_fps = 60      # 按时间推进时，factor、bias 等参数所对应的帧率
+time_based = False      # 动画是否默认按实际经过的时间推进
+
+
+def to_fast_value(value):
+    """
+    Convert a number or a sequence of up to 4 numbers into float or tuple of floats
+    :param value: value passed to setCurrent or setTarget
+    :return: float, tuple of floats, or None if the value can not be converted
+    """
+    if isinstance(value, (int, float, numpy.number)):
+        return float(value)
+
+    if isinstance(value, numpy.ndarray):
+        if value.dtype.kind not in "iuf" or value.ndim > 1 or value.size == 0 or value.size > 4:
+            return None
+        return float(value) if value.ndim == 0 else tuple(value.astype(numpy.float64).tolist())
 
+    if isinstance(value, (list, tuple)) and 0 < len(value) <= 4:
+        if all(isinstance(item, (int, float, numpy.number)) for item in value):
+            return tuple(float(item) for item in value)
 
-class Curve:
-    def LINEAR(self, x):
-        return x
+    return None
+
+
+def from_fast_value(value):
+    """
+    Convert a value stored by the fast path back into numpy array, other values are returned as they are
+    :param value: float, tuple of floats, or anything stored by setCurrent and setTarget
+    :return: numpy array
+    """
+    if type(value) is float or type(value) is tuple:
+        return numpy.array(value)
+    return value
 
 
 class ABCSiAnimation(QObject):
@@ -22,14 +54,14 @@ class ABCSiAnimation(QObject):
         self.current_ = numpy.array(0)        # 当前值
         self.counter = 0                     # 计数器
 
-        # 构建计时器
-        self.timer = QTimer()
-        self.timer.setInterval(int(1000/global_fps))
-        self.timer.timeout.connect(self._process)  # 每经历 interval 时间，传入函数就被触发一次
+        # 动画不再持有自己的计时器，而是注册到相同间隔的全局时钟上，由时钟统一推进
+        self.clock_ = get_clock(int(1000/global_fps))
+
+        self.time_based = None               # 是否按实际经过的时间推进，None 表示跟随全局设置
+        self.last_frame_time = None          # 上一帧的时间，毫秒
 
-        # 构建行为计时器
-        self.action_timer = QTimer()
-        self.action_timer.setSingleShot(True)
+        self.visibility_policy = SiVisibilityPolicy.KeepRunning
+        self.paused_ = False                 # 是否因所属控件不可见而暂停
 
     def setEnable(self, on):
         self.enabled = on
@@ -43,7 +75,98 @@ class ABCSiAnimation(QObject):
         """
         set fps of the animation.
         """
-        self.timer.setInterval(int(1000 / fps))
+        self.setInterval(int(1000 / fps))
+
+    def setTimeBased(self, on):
+        """
+        Set whether the animation is advanced by the real elapsed time between frames instead of frame count.
+        Time based animations converge in the same wall-clock time even if frames are dropped.
+        :param on: True, False, or None to follow the global setting
+        """
+        self.time_based = on
+
+    def isTimeBased(self):
+        """
+        To check whether the animation is advanced by the real elapsed time
+        :return: bool
+        """
+        if self.time_based is None:
+            return time_based
+        return self.time_based
+
+    def _frameElapsed(self):
+        """
+        Get the time elapsed since the last frame of this animation.
+        The first frame after the animation starts is treated as one interval.
+        :return: msec
+        """
+        now = self.clock_.now()
+        last, self.last_frame_time = self.last_frame_time, now
+        if last is None:
+            return self.interval()
+        return now - last
+
+    def _referenceFrames(self):
+        """
+        Get how many reference frames (see reference_fps) have elapsed since the last frame of this animation
+        :return: float
+        """
+        return self._frameElapsed() / int(1000 / reference_fps)
+
+    def setVisibilityPolicy(self, policy: SiVisibilityPolicy):
+        """
+        Set what the animation does when its parent widget is not visible,
+        for example hidden, or in a non-current page of a stacked container.
+        :param policy: SiVisibilityPolicy
+        """
+        self.visibility_policy = policy
+
+    def visibilityPolicy(self):
+        """
+        Returns the visibility policy of this animation
+        :return: SiVisibilityPolicy
+        """
+        return self.visibility_policy
+
+    def isPaused(self):
+        """
+        To check whether the animation is paused because its parent widget is not visible
+        :return: bool
+        """
+        return self.paused_
+
+    def _suspendIfHidden(self):
+        """
+        Apply the visibility policy if the parent widget is not visible. Called by the clock every frame.
+        :return: whether the animation is suspended in this frame
+        """
+        owner = self.parent()
+        if owner is None or owner.isWidgetType() is False or owner.isVisible():
+            return False
+
+        if self.visibility_policy == SiVisibilityPolicy.Finish:
+            self.finish()
+            return True
+
+        if self.visibility_policy == SiVisibilityPolicy.Pause:
+            self.clock_.unregister(self)
+            if self.paused_ is False:
+                self.paused_ = True
+                owner.installEventFilter(self)  # 等待控件重新显示
+            return True
+
+        return False
+
+    def _cancelPause(self):
+        if self.paused_:
+            self.paused_ = False
+            if self.parent() is not None:
+                self.parent().removeEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if self.paused_ and event.type() == QEvent.Show:
+            self._start()
+        return False
 
     def setTarget(self, target):
         """
@@ -64,23 +187,23 @@ class ABCSiAnimation(QObject):
     def current(self):
         """
         Returns the current value of the animation counter
-        :return: Current Value
+        :return: Current Value, numpy array
         """
-        return self.current_
+        return from_fast_value(self.current_)
 
     def target(self):
         """
         Returns the target value of the animation counter
-        :return: Target value
+        :return: Target value, numpy array
         """
-        return self.target_
+        return from_fast_value(self.target_)
 
     def _distance(self):
         """
         Get the D-value between current and target.
         :return: D-value
         """
-        return self.target_ - self.current_
+        return numpy.subtract(self.target_, self.current_)
 
     def _step_length(self):
         raise NotImplementedError()
@@ -88,6 +211,17 @@ class ABCSiAnimation(QObject):
     def _process(self):
         raise NotImplementedError()
 
+    @classmethod
+    def _process_many(cls, animations):
+        """
+        Advance a group of animations of this class by one frame.
+        Subclasses can override this to advance the whole group at once.
+        :param animations: list of animations whose type is exactly this class
+        """
+        for ani in animations:
+            if ani.isActive():  # 可能在本帧中被前面的动画停止
+                ani._process()
+
     def isCompleted(self):
         """
         To check whether we meet the point that the animation should stop
@@ -97,10 +231,34 @@ class ABCSiAnimation(QObject):
 
     def isActive(self):
         """
-        To check whether the timer of this animation is activated
+        To check whether this animation is being advanced by its clock
         :return: bool
         """
-        return self.timer.isActive()
+        return self.clock_.isRegistered(self)
+
+    def clock(self):
+        """
+        Returns the clock which advances this animation
+        :return: SiAnimationClock
+        """
+        return self.clock_
+
+    def interval(self):
+        """
+        Returns the time interval of the animation frames
+        :return: msec
+        """
+        return self.clock_.interval()
+
+    def _stop(self):
+        self._cancelPause()
+        self.clock_.unregister(self)
+
+    def _start(self):
+        self._cancelPause()
+        if not self.isActive():
+            self.last_frame_time = None
+        self.clock_.register(self)
 
     def stop(self, delay=None):
         """
@@ -108,9 +266,9 @@ class ABCSiAnimation(QObject):
         :param delay: msec, time delay before this action works
         """
         if delay is None:
-            self.timer.stop()
+            self._stop()
         else:
-            self.action_timer.singleShot(delay, self.timer.stop)
+            self.clock_.singleShot(delay, self._stop)
 
     def start(self, delay=None):
         """
@@ -121,17 +279,33 @@ class ABCSiAnimation(QObject):
             return
 
         if delay is None:
-            self.timer.start()
+            self._start()
         else:
-            self.action_timer.singleShot(delay, self.timer.start)
+            self.clock_.singleShot(delay, self._start)
+
+    def finish(self):
+        """
+        Stop the animation and let it jump to its target, ticked and finished signals are emitted
+        """
+        self.stop()
+        self.setCurrent(self.target_)
+        self.ticked.emit(self.current())
+        self.finished.emit(self.target())
 
     def setInterval(self, interval: int):
         """
-        Set the time interval of the timer
+        Set the time interval of the animation frames, the animation moves to the clock of this interval
         :param interval: Time interval (ms)
         :return:
         """
-        self.timer.setInterval(interval)
+        if interval == self.clock_.interval():
+            return
+
+        active = self.isActive()
+        self._stop()
+        self.clock_ = get_clock(interval)
+        if active:
+            self._start()
 
     def try_to_start(self, delay=None):
         """
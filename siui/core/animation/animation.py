@@ -1,10 +1,19 @@
 import numpy
 
-from .abstract import ABCSiAnimation, Curve
+from .abstract import ABCSiAnimation, to_fast_value
+from .curve import Curve, SiCurve
+
+# 同一帧中活动的 SiExpAnimation 数量达到该值时，使用批量运算推进它们
+batch_threshold = 64
 
 
 class SiExpAnimation(ABCSiAnimation):
-    """ Progression animation class, the step length of each animation is related to the current progress """
+    """
+    Progression animation class, the step length of each animation is related to the current progress.\n
+    Scalars and sequences of up to 4 numbers are stored as float and tuple of floats,
+    and stepped with plain float arithmetic instead of numpy.
+    current(), target() and the signals still give numpy arrays.
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -12,6 +21,14 @@ class SiExpAnimation(ABCSiAnimation):
         self.factor = 1/2
         self.bias = 1
 
+        # 子类重写了步进方法时，不能使用浮点数快速路径
+        self.fast_path_available = (type(self)._step_length is SiExpAnimation._step_length and
+                                    type(self)._process is SiExpAnimation._process)
+        self.fast_ = False
+        if self.fast_path_available:
+            self.setTarget(0)
+            self.setCurrent(0)
+
     def setFactor(self, factor: float):
         """
         Set the factor of the animation.
@@ -28,6 +45,84 @@ class SiExpAnimation(ABCSiAnimation):
             raise ValueError(f"Bias is expected to be positive but met {bias}")
         self.bias = bias
 
+    def setTarget(self, target):
+        if self.fast_path_available:
+            value = to_fast_value(target)
+            if value is not None:
+                self.target_ = value
+                self._refresh_fast_state()
+                return
+        super().setTarget(target)
+        self.fast_ = False
+
+    def setCurrent(self, current):
+        if self.fast_path_available:
+            value = to_fast_value(current)
+            if value is not None:
+                self.current_ = value
+                self._refresh_fast_state()
+                return
+        super().setCurrent(current)
+        self.fast_ = False
+
+    def _refresh_fast_state(self):
+        current, target = self.current_, self.target_
+        self.fast_ = ((type(current) is float and type(target) is float) or
+                      (type(current) is tuple and type(target) is tuple and len(current) == len(target)))
+
+    def _step_scalar(self, current: float, target: float):
+        """ The same calculation as _step_length, for a single float. Returns the new current value """
+        dis = target - current
+        dis_abs = abs(dis)
+        if dis_abs <= self.bias:
+            return current + dis
+        step = dis_abs * self.factor + self.bias
+        return current + (step if dis > 0 else -step)
+
+    def _left_distance(self, dis_abs, frames):
+        """
+        Get the distance left after some reference frames, which is the closed form of
+        applying `distance = distance * (1 - factor) - bias` for `frames` times.
+        :param dis_abs: absolute distance, float or numpy array
+        :param frames: number of reference frames, not necessarily an integer
+        :return: distance left, not positive if the target is reached
+        """
+        factor, bias = self.factor, self.bias
+        if factor <= 0:
+            return dis_abs - bias * frames
+        if factor >= 1:
+            return dis_abs * 0
+        return (dis_abs + bias / factor) * (1 - factor) ** frames - bias / factor
+
+    def _step_scalar_timed(self, current: float, target: float, frames: float):
+        """ Time based version of _step_scalar. Returns the new current value """
+        dis = target - current
+        dis_abs = abs(dis)
+        if dis_abs <= self.bias:
+            return target
+        left = self._left_distance(dis_abs, frames)
+        if left <= 0:
+            return target
+        return target - left if dis > 0 else target + left
+
+    def _advance_timed(self, frames):
+        """
+        Advance the current value by the given number of reference frames
+        :param frames: number of reference frames elapsed
+        """
+        if self.fast_:
+            if type(self.current_) is float:
+                self.current_ = self._step_scalar_timed(self.current_, self.target_, frames)
+            else:
+                self.current_ = tuple(self._step_scalar_timed(current, target, frames)
+                                      for current, target in zip(self.current_, self.target_))
+            return
+
+        dis = self._distance()
+        dis_abs = abs(dis)
+        left = numpy.where(dis_abs <= self.bias, 0, numpy.clip(self._left_distance(dis_abs, frames), 0, None))
+        self.setCurrent(self.target_ - numpy.sign(dis) * left)
+
     def _step_length(self):
         dis = self._distance()
         if (abs(dis) <= self.bias).all() is True:
@@ -41,22 +136,119 @@ class SiExpAnimation(ABCSiAnimation):
 
     def isCompleted(self):
         """ To check whether we meet the point that the animation should stop """
+        if self.fast_:
+            return self.current_ == self.target_
         return (self._distance() == 0).all()
 
     def _process(self):
         # 如果已经到达既定位置，终止计时器，并发射停止信号
         if self.isCompleted():
             self.stop()
-            self.finished.emit(self.target_)
+            self.finished.emit(self.target())
             return
 
-        step_length = self._step_length()
-
         # 更新数值
-        self.setCurrent(self.current_ + step_length)
+        if self.isTimeBased():
+            self._advance_timed(self._referenceFrames())
+        elif self.fast_:
+            if type(self.current_) is float:
+                self.current_ = self._step_scalar(self.current_, self.target_)
+            else:
+                self.current_ = tuple(map(self._step_scalar, self.current_, self.target_))
+        else:
+            step_length = self._step_length()
+            self.setCurrent(self.current_ + step_length)
 
         # 发射信号
-        self.ticked.emit(self.current_)
+        self.ticked.emit(self.current())
+
+    @classmethod
+    def _process_many(cls, animations):
+        """
+        Advance all the animations with one set of vectorized operations,
+        then emit the results one by one. The results are the same as running _process on each animation.
+        """
+        # 只有使用浮点数快速路径的动画可以被打包，其余的逐个推进
+        packed = [ani for ani in animations if ani.fast_]
+        if cls.isCompleted is not SiExpAnimation.isCompleted or len(packed) < batch_threshold:
+            super()._process_many(animations)
+            return
+        super()._process_many([ani for ani in animations if not ani.fast_])
+
+        currents = [ani.current_ for ani in packed]
+        targets = [ani.target_ for ani in packed]
+        sizes = [1 if type(current) is float else len(current) for current in currents]
+        offsets = numpy.concatenate(([0], numpy.cumsum(sizes)[:-1]))
+
+        # 按时间推进的动画在此计算经过的帧数，回退到逐个推进时需要恢复其上一帧时间
+        last_frame_times = [ani.last_frame_time for ani in packed]
+        frames_list = [ani._referenceFrames() if ani.isTimeBased() else None for ani in packed]
+
+        current = numpy.fromiter(_flatten(currents), dtype=numpy.float64, count=sum(sizes))
+        target = numpy.fromiter(_flatten(targets), dtype=numpy.float64, count=sum(sizes))
+        factor = numpy.repeat([ani.factor for ani in packed], sizes)
+        bias = numpy.repeat([ani.bias for ani in packed], sizes)
+        frames = numpy.repeat([numpy.nan if frames is None else frames for frames in frames_list], sizes)
+
+        result = _exp_step_many(current, target, factor, bias, frames).tolist()
+        completed = numpy.logical_and.reduceat(current == target, offsets).tolist()
+
+        for i, ani in enumerate(packed):
+            if ani.isActive() is False:  # 在本帧中被前面的动画停止
+                continue
+
+            # 当前值或目标值在本帧中被前面的动画修改，按原方式重新计算
+            if (ani.current_ is not currents[i]) or (ani.target_ is not targets[i]):
+                ani.last_frame_time = last_frame_times[i]
+                ani._process()
+                continue
+
+            if completed[i]:
+                ani.stop()
+                ani.finished.emit(ani.target())
+                continue
+
+            offset = offsets[i]
+            if type(currents[i]) is float:
+                ani.current_ = result[offset]
+            else:
+                ani.current_ = tuple(result[offset:offset + sizes[i]])
+            ani.ticked.emit(ani.current())
+
+
+def _exp_step_many(current, target, factor, bias, frames):
+    """
+    Vectorized step of SiExpAnimation, the same calculation as _step_scalar and _step_scalar_timed.
+    :param frames: reference frames elapsed for time based elements, nan for the others
+    :return: new current values
+    """
+    # 与 _step_length 相同的运算，但一次作用于所有动画
+    dis = target - current
+    dis_abs = abs(dis)
+    cut = dis_abs <= bias
+    arr = (dis_abs * factor + bias) * numpy.where(dis > 0, 1, -1)
+    arr = numpy.where(cut, dis, arr)
+    result = current + arr
+
+    # 按时间推进的元素使用闭式解
+    timed = ~numpy.isnan(frames)
+    if timed.any():
+        frames = numpy.where(timed, frames, 1)
+        safe_factor = numpy.where((factor > 0) & (factor < 1), factor, 0.5)
+        left = (dis_abs + bias / safe_factor) * (1 - safe_factor) ** frames - bias / safe_factor
+        left = numpy.where(factor <= 0, dis_abs - bias * frames, numpy.where(factor >= 1, 0, left))
+        left = numpy.where(cut | (left <= 0), 0, left)
+        result = numpy.where(timed, target - numpy.copysign(left, dis), result)
+
+    return result
+
+
+def _flatten(values):
+    for value in values:
+        if type(value) is float:
+            yield value
+        else:
+            yield from value
 
 
 class SiExpAccelerateAnimation(SiExpAnimation):
@@ -87,6 +279,17 @@ class SiExpAccelerateAnimation(SiExpAnimation):
         arr = arr * (1 - cut) + dis * cut  # 对于差距小于偏置的项，直接返回差距
         return arr
 
+    def _advance_timed(self, frames):
+        self.frame_counter += frames - 1  # _process 已经计入了一帧
+        self.refreshStepLengthBound()
+
+        dis = self._distance()
+        dis_abs = abs(dis)
+        step = dis_abs - numpy.clip(self._left_distance(dis_abs, frames), 0, None)
+        step = numpy.clip(step, 0, self.step_length_bound * frames)
+        step = numpy.where(dis_abs <= self.bias, dis_abs, step)
+        self.setCurrent(self.current_ + numpy.sign(dis) * step)
+
     def _process(self):
         self.frame_counter += 1
         self.refreshStepLengthBound()
@@ -171,17 +374,25 @@ class SiCounterAnimation(ABCSiAnimation):
         :return:
         """
         duration = self.duration
-        interval = self.timer.spacing()  # 两个值全是 毫秒 ms
+        interval = self.interval()  # 两个值全是 毫秒 ms
         return interval / duration
 
     def setCurve(self, curve_func):
         """
         Set the animation curve.
-        :param curve_func: a function which expect an input between 0 and 1, return a float number
+        :param curve_func: a function which expect an input between 0 and 1, return a float number.
+                           Curves in `Curve` are sampled into tables and cheaper to evaluate
         :return:
         """
         self.curve = curve_func
 
+    def finish(self):
+        self.stop()
+        self.counter = 0 if self.reversed else 1
+        self.setCurrent(self.curve(self.counter))
+        self.ticked.emit(self.current_)
+        self.finished.emit(self.target_)
+
     def isCompleted(self):
         """
         To check whether we meet the point that the animation should stop
@@ -197,11 +408,203 @@ class SiCounterAnimation(ABCSiAnimation):
             self.finished.emit(self.target_)
             return
 
-        # 计数器更新
-        self.counter = self.counter + (-1 if self.reversed else 1) * self.counter_addend
+        self._advance_counter()
 
         # 更新数值
         self.setCurrent(self.curve(self.counter))
 
         # 发射信号
         self.ticked.emit(self.current_)
+
+    def _advance_counter(self):
+        # 计数器更新，按时间推进时，步长由实际经过的时间决定
+        addend = self._frameElapsed() / self.duration if self.isTimeBased() else self.counter_addend
+        self.counter = self.counter + (-1 if self.reversed else 1) * addend
+
+    @classmethod
+    def _process_many(cls, animations):
+        """
+        Advance all the animations, the ones using the same SiCurve are evaluated in one vectorized call
+        """
+        if cls._process is not SiCounterAnimation._process or len(animations) < batch_threshold:
+            super()._process_many(animations)
+            return
+
+        # 先推进所有计数器，并按曲线分组
+        groups = {}
+        for ani in animations:
+            if ani.isActive() is False:
+                continue
+            if ani.isCompleted():
+                ani.stop()
+                ani.finished.emit(ani.target_)
+                continue
+            ani._advance_counter()
+            groups.setdefault(ani.curve, []).append(ani)
+
+        for curve, group in groups.items():
+            if isinstance(curve, SiCurve):
+                values = curve.evaluateMany([ani.counter for ani in group]).tolist()
+            else:
+                values = [curve(ani.counter) for ani in group]
+
+            for ani, value in zip(group, values):
+                ani.setCurrent(value)
+                ani.ticked.emit(ani.current_)
+
+
+class SiSpringAnimation(ABCSiAnimation):
+    """
+    Physically based spring animation. The current value is attached to the target by a damped spring,
+    and each frame is advanced with the closed-form solution, so it is stable at any frame interval.
+    Velocity is kept when the target changes, so interrupting the animation stays smooth.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.mass = 1
+        self.stiffness = 170
+        self.damping = 26
+        self.precision = 0.1                # 位移与速度（每秒）均小于该值时，认为动画已经完成
+        self.velocity_ = numpy.array(0.0)   # 每秒的速度
+
+    def setMass(self, mass: float):
+        """
+        Set the mass attached to the spring
+        :param mass: positive float number
+        """
+        if mass <= 0:
+            raise ValueError(f"Mass is expected to be positive but met {mass}")
+        self.mass = mass
+
+    def setStiffness(self, stiffness: float):
+        """
+        Set the stiffness of the spring
+        :param stiffness: positive float number
+        """
+        if stiffness <= 0:
+            raise ValueError(f"Stiffness is expected to be positive but met {stiffness}")
+        self.stiffness = stiffness
+
+    def setDamping(self, damping: float):
+        """
+        Set the damping coefficient. The spring is critically damped when damping = 2 * sqrt(stiffness * mass)
+        :param damping: non-negative float number
+        """
+        if damping < 0:
+            raise ValueError(f"Damping is expected to be non-negative but met {damping}")
+        self.damping = damping
+
+    def setPrecision(self, precision: float):
+        """
+        Set the precision of the animation, the animation completes when
+        both the distance and the velocity per second are smaller than it.
+        :param precision: positive float number
+        """
+        if precision <= 0:
+            raise ValueError(f"Precision is expected to be positive but met {precision}")
+        self.precision = precision
+
+    def setVelocity(self, velocity):
+        """
+        Set the current velocity of the animation
+        :param velocity: velocity per second
+        """
+        self.velocity_ = numpy.array(velocity, dtype=numpy.float64)
+
+    def velocity(self):
+        """
+        Returns the current velocity of the animation
+        :return: velocity per second
+        """
+        return self.velocity_
+
+    def dampingRatio(self):
+        """
+        Returns the damping ratio of the spring. It is less than 1 if the spring oscillates.
+        :return: float
+        """
+        return self.damping / (2 * (self.stiffness * self.mass) ** 0.5)
+
+    def settlingTime(self):
+        """
+        Returns the estimated time for the spring to settle from rest, in msec
+        """
+        omega = (self.stiffness / self.mass) ** 0.5
+        zeta = self.dampingRatio()
+        if zeta < 1:
+            decay_rate = zeta * omega
+        else:
+            decay_rate = omega * (zeta - (zeta ** 2 - 1) ** 0.5)  # 较慢的那个指数项决定收敛时间
+        return 1000 * 4 / max(decay_rate, 1e-9)
+
+    def _solve(self, displacement, velocity, t):
+        """
+        Solve the spring system after t seconds.
+        :param displacement: current - target
+        :param velocity: velocity per second
+        :param t: time in seconds
+        :return: displacement and velocity after t seconds
+        """
+        omega = (self.stiffness / self.mass) ** 0.5
+        zeta = self.dampingRatio()
+
+        if abs(zeta - 1) < 1e-6:  # 临界阻尼
+            decay = numpy.exp(-omega * t)
+            b = velocity + omega * displacement
+            return (displacement + b * t) * decay, (velocity - omega * b * t) * decay
+
+        if zeta < 1:  # 欠阻尼
+            omega_d = omega * (1 - zeta ** 2) ** 0.5
+            a = zeta * omega
+            decay = numpy.exp(-a * t)
+            cos, sin = numpy.cos(omega_d * t), numpy.sin(omega_d * t)
+            b = (velocity + a * displacement) / omega_d
+            return ((displacement * cos + b * sin) * decay,
+                    (velocity * cos - (a * b + displacement * omega_d) * sin) * decay)
+
+        # 过阻尼
+        root = (zeta ** 2 - 1) ** 0.5
+        r1, r2 = -omega * (zeta - root), -omega * (zeta + root)
+        c1 = (velocity - r2 * displacement) / (r1 - r2)
+        c2 = displacement - c1
+        e1, e2 = numpy.exp(r1 * t), numpy.exp(r2 * t)
+        return c1 * e1 + c2 * e2, r1 * c1 * e1 + r2 * c2 * e2
+
+    def isCompleted(self):
+        """ To check whether we meet the point that the animation should stop """
+        return (self._distance() == 0).all() and (self.velocity_ == 0).all()
+
+    def _process(self):
+        # 如果已经到达既定位置，终止计时器，并发射停止信号
+        if self.isCompleted():
+            self.stop()
+            self.finished.emit(self.target_)
+            return
+
+        elapsed = self._frameElapsed() if self.isTimeBased() else self.interval()
+        displacement = -self._distance()
+        velocity = self.velocity_
+        if velocity.shape != displacement.shape:  # 数值的形状发生了变化，标量速度被广播，否则重置
+            if velocity.size == 1:
+                velocity = velocity * numpy.ones(displacement.shape)
+            else:
+                velocity = numpy.zeros(displacement.shape)
+
+        displacement, velocity = self._solve(displacement, velocity, elapsed / 1000)
+
+        # 足够接近静止时，直接到达目标
+        if (abs(displacement) < self.precision).all() and (abs(velocity) < self.precision).all():
+            self.velocity_ = numpy.zeros(displacement.shape)
+            self.setCurrent(self.target_)
+        else:
+            self.velocity_ = velocity
+            self.setCurrent(self.target_ + displacement)
+
+        # 发射信号
+        self.ticked.emit(self.current_)
+
+    def finish(self):
+        self.velocity_ = numpy.zeros(numpy.shape(self.velocity_))
+        super().finish()
@@ -0,0 +1,242 @@
+import heapq
+import itertools
+import time
+from enum import Enum, auto
+
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QTimer
+
+
+class SiVisibilityPolicy(Enum):
+    # What an animation does when the widget it belongs to (its parent) is not visible
+    KeepRunning = auto()    # Keep running as usual
+    Finish = auto()         # Jump to the target immediately, finished signal is emitted
+    Pause = auto()          # Pause, and resume when the widget is shown again
+
+
+class SiAnimationClock(QObject):
+    """
+    Frame clock shared by every animation running at the same interval.\n
+    One timer advances all registered animations in a single pass per frame,
+    and stops completely when no animation is registered.
+    """
+    def __init__(self, interval: int, parent=None):
+        super().__init__(parent)
+
+        self.interval_ = interval
+        self.animations = {}  # 以字典作为有序集合，保证按注册顺序推进动画
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self._tick)
+
+    def interval(self):
+        """
+        Returns the interval of this clock
+        :return: msec
+        """
+        return self.interval_
+
+    def now(self):
+        """
+        Returns the current time of this clock
+        :return: msec
+        """
+        return _backend.now()
+
+    def singleShot(self, delay: int, callback):
+        """
+        Call the callback once after the delay, timed in the same way as this clock
+        :param delay: msec
+        :param callback: function
+        """
+        _backend.singleShot(delay, callback)
+
+    def register(self, ani):
+        """
+        Register an animation, it will be advanced from the next frame on
+        :param ani: animation
+        """
+        self.animations[ani] = None
+        if not _backend.isTicking(self):
+            _backend.startTicking(self)
+
+    def unregister(self, ani):
+        """
+        Unregister an animation, the clock sleeps if nothing is left
+        :param ani: animation
+        """
+        if ani not in self.animations:
+            return
+        del self.animations[ani]
+        if len(self.animations) == 0:
+            _backend.stopTicking(self)
+
+    def isRegistered(self, ani):
+        """
+        To check whether the animation is advanced by this clock
+        :return: bool
+        """
+        return ani in self.animations
+
+    def isActive(self):
+        """
+        To check whether this clock is ticking
+        :return: bool
+        """
+        return _backend.isTicking(self)
+
+    def _tick(self):
+        # 按动画类型分组，使同类动画可以在一次运算中被批量推进
+        groups = {}
+        for ani in list(self.animations):
+            if sip.isdeleted(ani):  # 动画已经随其父对象被销毁
+                self.unregister(ani)
+                continue
+            if ani.visibility_policy is not SiVisibilityPolicy.KeepRunning and ani._suspendIfHidden():
+                continue
+            groups.setdefault(type(ani), []).append(ani)
+
+        for cls, animations in groups.items():
+            cls._process_many(animations)
+
+        if len(self.animations) == 0:
+            _backend.stopTicking(self)
+
+
+class SiTimerClockBackend:
+    """
+    The default clock backend, clocks are driven by QTimer and wall-clock time
+    """
+    def now(self):
+        return time.perf_counter() * 1000
+
+    def singleShot(self, delay: int, callback):
+        QTimer.singleShot(delay, callback)
+
+    def startTicking(self, clock: SiAnimationClock):
+        clock.timer.start()
+
+    def stopTicking(self, clock: SiAnimationClock):
+        clock.timer.stop()
+
+    def isTicking(self, clock: SiAnimationClock):
+        return clock.timer.isActive()
+
+
+class SiManualClockBackend:
+    """
+    Clock backend driven by hand, for tests and benchmarks.\n
+    Time only passes when advance() or run_until_idle() is called, and every frame and delayed action
+    due in that time is run synchronously, so the results are deterministic and no event loop is needed.
+    """
+    def __init__(self, start_time: float = 0):
+        """
+        :param start_time: virtual time to start from, msec
+        """
+        self.time_ = start_time
+        self.next_ticks = {}                # 正在运行的时钟，值为下一帧的时间
+        self.pending = []                   # 延时执行的函数，按 (时间, 序号, 函数) 组成的堆
+        self.sequence = itertools.count()   # 时间相同时，按加入顺序执行
+
+    def now(self):
+        return self.time_
+
+    def singleShot(self, delay: int, callback):
+        heapq.heappush(self.pending, (self.time_ + delay, next(self.sequence), callback))
+
+    def startTicking(self, clock: SiAnimationClock):
+        self.next_ticks[clock] = self.time_ + clock.interval()
+
+    def stopTicking(self, clock: SiAnimationClock):
+        self.next_ticks.pop(clock, None)
+
+    def isTicking(self, clock: SiAnimationClock):
+        return clock in self.next_ticks
+
+    def isIdle(self):
+        """
+        To check whether no clock is ticking and no delayed action is waiting
+        :return: bool
+        """
+        return len(self.next_ticks) == 0 and len(self.pending) == 0
+
+    def _nextDue(self):
+        due = min(self.next_ticks.values(), default=None)
+        if self.pending and (due is None or self.pending[0][0] <= due):
+            due = self.pending[0][0]
+        return due
+
+    def _runDue(self, due):
+        self.time_ = due
+
+        # 先执行延时的函数，它们可能会启动或停止动画
+        while self.pending and self.pending[0][0] <= due:
+            heapq.heappop(self.pending)[2]()
+
+        for clock, tick_time in list(self.next_ticks.items()):
+            if tick_time <= due and clock in self.next_ticks:
+                self.next_ticks[clock] = tick_time + clock.interval()
+                clock._tick()
+
+    def advance(self, ms: float):
+        """
+        Let the time pass, and run every frame and delayed action due in it
+        :param ms: msec
+        """
+        end = self.time_ + ms
+        while True:
+            due = self._nextDue()
+            if due is None or due > end:
+                break
+            self._runDue(due)
+        self.time_ = end
+
+    def run_until_idle(self, timeout: float = 60000):
+        """
+        Let the time pass until all the animations stop and no delayed action is waiting
+        :param timeout: msec, max time allowed to pass. Animations that never stop make it raise
+        :return: time passed, msec
+        """
+        start = self.time_
+        while not self.isIdle():
+            due = self._nextDue()
+            if due - start > timeout:
+                raise RuntimeError(f"Animations are still running after {timeout} ms")
+            self._runDue(due)
+        return self.time_ - start
+
+
+_backend = SiTimerClockBackend()
+_clocks = {}
+
+
+def set_clock_backend(backend):
+    """
+    Set the backend which drives all the clocks, clocks that are ticking continue on the new backend
+    :param backend: SiTimerClockBackend, SiManualClockBackend or an object with the same methods
+    """
+    global _backend
+    old, _backend = _backend, backend
+    for clock in _clocks.values():
+        if old.isTicking(clock):
+            old.stopTicking(clock)
+            backend.startTicking(clock)
+
+
+def get_clock_backend():
+    """
+    Returns the backend which drives all the clocks
+    """
+    return _backend
+
+
+def get_clock(interval: int) -> SiAnimationClock:
+    """
+    Get the process-wide clock of the given interval, create it if it doesn't exist
+    :param interval: msec
+    :return: SiAnimationClock
+    """
+    if interval not in _clocks:
+        _clocks[interval] = SiAnimationClock(interval)
+    return _clocks[interval]
@@ -0,0 +1,117 @@
+import functools
+
+import numpy
+
+# 每条曲线在 [0, 1] 上的采样点数
+curve_samples = 1025
+
+
+class SiCurve:
+    """
+    Easing curve sampled into a dense table once, and evaluated by linear interpolation.\n
+    Instances are callable, so they can be passed to SiCounterAnimation.setCurve like any function.
+    """
+    def __init__(self, function, samples: int = None):
+        """
+        :param function: a function which accepts a numpy array of inputs between 0 and 1
+        :param samples: number of samples in the table
+        """
+        samples = curve_samples if samples is None else samples
+        self.xs = numpy.linspace(0, 1, samples)
+        self.table = numpy.asarray(function(self.xs), dtype=numpy.float64)
+        self.table_list = self.table.tolist()  # 单个求值时使用，避免 numpy 的开销
+        self.last_index = samples - 1
+
+    def __call__(self, x):
+        x = min(max(float(x), 0.0), 1.0)
+        position = x * self.last_index
+        index = min(int(position), self.last_index - 1)
+        left = self.table_list[index]
+        return left + (self.table_list[index + 1] - left) * (position - index)
+
+    def evaluateMany(self, xs):
+        """
+        Evaluate the curve on many inputs at once
+        :param xs: array of inputs, they are clipped to [0, 1]
+        :return: numpy array of outputs
+        """
+        return numpy.interp(numpy.clip(xs, 0, 1), self.xs, self.table)
+
+
+def _in_out(ease_in):
+    def function(x):
+        return numpy.where(x < 0.5, ease_in(2 * x) / 2, 1 - ease_in(2 - 2 * x) / 2)
+    return function
+
+
+def _back_in(x, overshoot=1.70158):
+    return (overshoot + 1) * x ** 3 - overshoot * x ** 2
+
+
+def _elastic_out(x):
+    return numpy.where(x >= 1, 1, 2 ** (-10 * x) * numpy.sin((x * 10 - 0.75) * (2 * numpy.pi / 3)) + 1)
+
+
+class Curve:
+    """
+    Standard easing curves. The ones with parameters are created by the static methods and cached.
+    """
+    LINEAR = SiCurve(lambda x: x)
+
+    EASE_IN_CUBIC = SiCurve(lambda x: x ** 3)
+    EASE_OUT_CUBIC = SiCurve(lambda x: 1 - (1 - x) ** 3)
+    EASE_IN_OUT_CUBIC = SiCurve(_in_out(lambda x: x ** 3))
+
+    EASE_IN_QUINT = SiCurve(lambda x: x ** 5)
+    EASE_OUT_QUINT = SiCurve(lambda x: 1 - (1 - x) ** 5)
+    EASE_IN_OUT_QUINT = SiCurve(_in_out(lambda x: x ** 5))
+
+    EASE_IN_BACK = SiCurve(_back_in)
+    EASE_OUT_BACK = SiCurve(lambda x: 1 - _back_in(1 - x))
+    EASE_IN_OUT_BACK = SiCurve(_in_out(lambda x: _back_in(x, 1.70158 * 1.525)))
+
+    EASE_OUT_ELASTIC = SiCurve(_elastic_out)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def bezier(x1: float, y1: float, x2: float, y2: float) -> SiCurve:
+        """
+        Cubic bezier curve from (0, 0) to (1, 1), the same as `cubic-bezier` in CSS
+        :param x1: x of the first control point, between 0 and 1
+        :param y1: y of the first control point
+        :param x2: x of the second control point, between 0 and 1
+        :param y2: y of the second control point
+        :return: SiCurve
+        """
+        if not (0 <= x1 <= 1 and 0 <= x2 <= 1):
+            raise ValueError(f"x of control points are expected to be between 0 and 1 but met {x1}, {x2}")
+
+        # 对参数 t 密集采样，再通过插值求反函数，代替每次求值时的牛顿迭代
+        t = numpy.linspace(0, 1, curve_samples * 4)
+        bx = 3 * (1 - t) ** 2 * t * x1 + 3 * (1 - t) * t ** 2 * x2 + t ** 3
+        by = 3 * (1 - t) ** 2 * t * y1 + 3 * (1 - t) * t ** 2 * y2 + t ** 3
+        return SiCurve(lambda x: numpy.interp(x, bx, by))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def spring(damping_ratio: float = 0.5, frequency: float = 12) -> SiCurve:
+        """
+        Damped spring curve which settles at 1 when the input reaches 1
+        :param damping_ratio: damping ratio, between 0 and 1. Smaller value makes more oscillations
+        :param frequency: angular frequency of the spring, in radians per unit input
+        :return: SiCurve
+        """
+        if not (0 < damping_ratio < 1):
+            raise ValueError(f"Damping ratio is expected to be between 0 and 1 but met {damping_ratio}")
+
+        damped_frequency = frequency * (1 - damping_ratio ** 2) ** 0.5
+
+        def function(x):
+            decay = numpy.exp(-damping_ratio * frequency * x)
+            oscillation = (numpy.cos(damped_frequency * x) +
+                           damping_ratio * frequency / damped_frequency * numpy.sin(damped_frequency * x))
+            return 1 - decay * oscillation
+
+        # 修正终点误差，保证曲线在 1 处恰好为 1
+        error = 1 - function(numpy.float64(1))
+        return SiCurve(lambda x: function(x) + error * x)
@@ -6,17 +6,120 @@ class SiAnimationGroup:
     Animation groups provide support for managing multiple animations and allow access to animation objects using tokens
     """
     def __init__(self):
-        self.animations = []
-        self.tokens = []
+        self.members = {}    # token -> 动画，尚未创建的动画为 None，按加入顺序排列
+        self.factories = {}  # 尚未创建的动画，键为 token，值为创建动画的函数
+        self.paused = []     # 被 pauseAll 暂停的动画
 
     def addMember(self, ani, token: str):
-        if token in self.tokens:
+        if self.hasMember(token):
             raise ValueError(f"Code already exists: {token}")
-        self.animations.append(ani)
-        self.tokens.append(token)
+        self.members[token] = ani
+
+    def addLazyMember(self, factory, token: str):
+        """
+        Add an animation which is created by calling factory() when it is accessed for the first time
+        :param factory: a function which returns the animation
+        :param token: token of the animation
+        """
+        if self.hasMember(token):
+            raise ValueError(f"Code already exists: {token}")
+        self.members[token] = None
+        self.factories[token] = factory
+
+    def removeMember(self, token: str) -> ABCSiAnimation:
+        """
+        Remove the animation of this token from the group, the animation is stopped
+        :param token: token of the animation
+        :return: the removed animation, or None if it has not been created yet
+        """
+        if token not in self.members:
+            raise ValueError(f"The passed in token was not found in the token group: {token}")
+
+        ani = self.members.pop(token)
+        if ani is None:
+            self.factories.pop(token)
+            return None
+        ani.stop()
+        if ani in self.paused:
+            self.paused.remove(ani)
+        return ani
+
+    def hasMember(self, token: str) -> bool:
+        """
+        To check whether the token is in this group, no matter the animation has been created or not
+        :param token: token of the animation
+        :return: bool
+        """
+        return token in self.members
+
+    def isCreated(self, token: str) -> bool:
+        """
+        To check whether the animation of this token has been created
+        :param token: token of the animation
+        :return: bool
+        """
+        return self.members.get(token) is not None
+
+    @property
+    def tokens(self):
+        """
+        Tokens of all the members in the order they were added, including the ones not created yet
+        :return: list of tokens
+        """
+        return list(self.members)
+
+    @property
+    def animations(self):
+        """
+        All the animations in the same order as tokens, the ones not created yet are created
+        :return: list of animations
+        """
+        return [self.fromToken(token) for token in self.members]
+
+    def _created(self):
+        return [ani for ani in self.members.values() if ani is not None]
 
     def fromToken(self, aim_token: str) -> ABCSiAnimation:
-        for ani, token in zip(self.animations, self.tokens):
-            if token == aim_token:
-                return ani
+        ani = self.members.get(aim_token)
+        if ani is not None:
+            return ani
+        if aim_token in self.factories:
+            ani = self.factories.pop(aim_token)()
+            self.members[aim_token] = ani
+            return ani
         raise ValueError(f"The passed in token was not found in the token group: {aim_token}")
+
+    def stopAll(self):
+        """ Stop all the created animations """
+        for ani in self._created():
+            ani.stop()
+        self.paused.clear()
+
+    def pauseAll(self):
+        """ Stop all the active animations, they can be started again by resumeAll """
+        for ani in self._created():
+            if ani.isActive():
+                ani.stop()
+                self.paused.append(ani)
+
+    def resumeAll(self):
+        """ Start the animations stopped by pauseAll """
+        paused, self.paused = self.paused, []
+        for ani in paused:
+            ani.start()
+
+    def finishAll(self):
+        """
+        Let all the active animations and the ones stopped by pauseAll jump to their targets,
+        finished signals are emitted
+        """
+        for ani in self._created():
+            if ani.isActive() or ani in self.paused:
+                ani.finish()
+        self.paused.clear()
+
+    def __contains__(self, token: str):
+        return self.hasMember(token)
+
+    def __iter__(self):
+        return iter(self._created())
@@ -1,9 +1,33 @@
 
+import functools
 from enum import Enum, auto
 from typing import Union
 
 import numpy
 
+# 颜色代码解析与格式化结果的缓存大小
+cache_size = 4096
+
+
+@functools.lru_cache(maxsize=cache_size)
+def _parse_code(code: str):
+    # 解析 `#AARRGGBB` 或 `#RRGGBB`，返回 (A, R, G, B)
+    data = code.lstrip("#")
+    if len(data) == 6:
+        value = 0xFF000000 | int(data, 16)
+    elif len(data) == 8:
+        value = int(data, 16)
+    else:
+        raise ValueError(f"Unexpected color code: {code}")
+    return (value >> 24) & 0xFF, (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+
+
+@functools.lru_cache(maxsize=cache_size)
+def _format_code(a: int, r: int, g: int, b: int, force_rgba: bool):
+    if (force_rgba is True) or (a != 255):
+        return f"#{a:02X}{r:02X}{g:02X}{b:02X}"
+    return f"#{r:02X}{g:02X}{b:02X}"
+
 
 class SiColor(Enum):
     THEME = auto()
@@ -101,16 +125,33 @@ class SiColor(Enum):
         if len(code_data) == 8:
             return code.upper()
 
-    @classmethod
-    def toArray(cls,
-                code: str):
+    @staticmethod
+    def toArray(code: str):
         """
         transform `#AARRGGBB` or `#RRGGBB` into `array(A, R, G, B, dtype=int16)`
         """
-        code = cls.RGB_to_RGBA(code)
-        code = code.lstrip("#")
-        a, r, g, b = int(code[0:2], 16), int(code[2:4], 16), int(code[4:6], 16), int(code[6:8], 16)
-        return numpy.array([a, r, g, b], dtype=numpy.int16)
+        return numpy.array(_parse_code(code), dtype=numpy.int16)
+
+    @staticmethod
+    def toTuple(code: str):
+        """
+        transform `#AARRGGBB` or `#RRGGBB` into `(A, R, G, B)`, the result is cached
+        """
+        return _parse_code(code)
+
+    @staticmethod
+    def toInt(code: str):
+        """
+        transform `#AARRGGBB` or `#RRGGBB` into packed 32-bit integer `0xAARRGGBB`, the result is cached
+        """
+        a, r, g, b = _parse_code(code)
+        return (a << 24) | (r << 16) | (g << 8) | b
+
+    @staticmethod
+    def fromInt(value: int, force_rgba=False):
+        """ transform packed 32-bit integer `0xAARRGGBB` into `#AARRGGBB` """
+        return _format_code((value >> 24) & 0xFF, (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF,
+                            force_rgba)
 
     @staticmethod
     def toCode(value: Union[numpy.ndarray, list], force_rgba=False):
@@ -121,36 +162,140 @@ class SiColor(Enum):
         elif len(value) == 4:
             a, r, g, b = value
         else:
-            raise ValueError(f"Unexpected shape of input: {value}, shape: {value.shape}")
+            raise ValueError(f"Unexpected shape of input: {value}, shape: {numpy.shape(value)}")
 
-        if (force_rgba is True) or (a != 255):
-            return f"#{int(a):02X}{int(r):02X}{int(g):02X}{int(b):02X}"
+        return _format_code(int(a), int(r), int(g), int(b), force_rgba is True)
 
-        else:
-            return f"#{int(r):02X}{int(g):02X}{int(b):02X}"
-
-    @classmethod
-    def mix(cls,
-            code_fore: str,
+    @staticmethod
+    @functools.lru_cache(maxsize=cache_size)
+    def mix(code_fore: str,
             code_post: str,
             weight: float = 0.5):
         """
         Mix the fore color and the post color, you can set the weight of the fore color.
         :return: color code of the mixed color
         """
-        fore_array = cls.toArray(code_fore)
-        post_array = cls.toArray(code_post)
-        mixed_rgb = fore_array * weight + post_array * (1-weight)
-        return cls.toCode(mixed_rgb)
+        fore = _parse_code(code_fore)
+        post = _parse_code(code_post)
+        return SiColor.toCode([f * weight + p * (1-weight) for f, p in zip(fore, post)])
 
-    @classmethod
-    def trans(cls,
-              code: str,
+    @staticmethod
+    @functools.lru_cache(maxsize=cache_size)
+    def trans(code: str,
               transparency: float = 0):
         """
         Set the transparency to a color based on current color
         """
-        value = cls.toArray(code)
-        value_proceed = value * numpy.array([transparency, 1, 1, 1])
-        code_proceed = cls.toCode(value_proceed)
-        return code_proceed
+        a, r, g, b = _parse_code(code)
+        return SiColor.toCode([a * transparency, r, g, b])
+
+    @staticmethod
+    def toArrayMany(codes):
+        """
+        transform many color codes into an `N×4` array of `(A, R, G, B)`, dtype=int16.
+        An `N×4` array is returned as it is
+        """
+        if isinstance(codes, numpy.ndarray):
+            return codes
+        if isinstance(codes, str):
+            codes = [codes]
+        return numpy.array([_parse_code(code) for code in codes], dtype=numpy.int16).reshape(-1, 4)
+
+    @staticmethod
+    def toCodeMany(values, force_rgba=False):
+        """ transform an `N×4` array of `(A, R, G, B)` into a list of color codes """
+        values = numpy.asarray(values).reshape(-1, 4).astype(numpy.int64)  # 与 int() 一样向零取整
+        return [_format_code(a, r, g, b, force_rgba is True) for a, r, g, b in values.tolist()]
+
+    @staticmethod
+    def mixMany(codes_fore,
+                codes_post,
+                weight=0.5,
+                as_array=False):
+        """
+        Mix colors pairwise in one vectorized operation, the same as calling `mix` on each pair.
+        :param codes_fore: color codes or an `N×4` array, a single code is applied to every pair
+        :param codes_post: color codes or an `N×4` array, a single code is applied to every pair
+        :param weight: weight of the fore colors, a float or an array of N floats
+        :param as_array: return an `N×4` array instead of color codes
+        :return: list of color codes
+        """
+        fore = SiColor.toArrayMany(codes_fore).astype(numpy.float64)
+        post = SiColor.toArrayMany(codes_post).astype(numpy.float64)
+        weight = numpy.asarray(weight, dtype=numpy.float64).reshape(-1, 1)
+        mixed = fore * weight + post * (1 - weight)
+        return mixed if as_array else SiColor.toCodeMany(mixed)
+
+    @staticmethod
+    def transMany(codes,
+                  transparency=0,
+                  as_array=False):
+        """
+        Set the transparency to many colors in one vectorized operation, the same as calling `trans` on each.
+        :param codes: color codes or an `N×4` array
+        :param transparency: a float or an array of N floats
+        :param as_array: return an `N×4` array instead of color codes
+        :return: list of color codes
+        """
+        values = SiColor.toArrayMany(codes).astype(numpy.float64)
+        values[:, 0] *= numpy.asarray(transparency, dtype=numpy.float64).reshape(-1)
+        return values if as_array else SiColor.toCodeMany(values)
+
+    @staticmethod
+    def lightenMany(codes,
+                    amount=0.1,
+                    as_array=False):
+        """
+        Move many colors towards white, or towards black when amount is negative. Alpha channels are kept.
+        :param codes: color codes or an `N×4` array
+        :param amount: between -1 and 1, a float or an array of N floats
+        :param as_array: return an `N×4` array instead of color codes
+        :return: list of color codes
+        """
+        values = SiColor.toArrayMany(codes).astype(numpy.float64)
+        amount = numpy.asarray(amount, dtype=numpy.float64).reshape(-1, 1)
+        rgb = values[:, 1:4]
+        values[:, 1:4] = numpy.where(amount >= 0, rgb + (255 - rgb) * amount, rgb * (1 + amount))
+        return values if as_array else SiColor.toCodeMany(values)
+
+    @staticmethod
+    def gradient(code_start: str,
+                 code_end: str,
+                 n: int,
+                 as_array=False):
+        """
+        Get n colors evenly distributed from the start color to the end color, both ends included
+        :param code_start: color code of the first color
+        :param code_end: color code of the last color
+        :param n: number of colors
+        :param as_array: return an `N×4` array instead of color codes
+        :return: list of color codes
+        """
+        return SiColor.mixMany(code_end, code_start, numpy.linspace(0, 1, n), as_array=as_array)
+
+    @staticmethod
+    def luminance(codes):
+        """
+        Get the relative luminance defined by WCAG, alpha channels are ignored
+        :param codes: a color code, color codes or an `N×4` array
+        :return: float for a single color code, otherwise array of N floats
+        """
+        rgb = SiColor.toArrayMany(codes)[:, 1:4] / 255
+        linear = numpy.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+        result = linear @ numpy.array([0.2126, 0.7152, 0.0722])
+        return float(result[0]) if isinstance(codes, str) else result
+
+    @staticmethod
+    def contrast(codes_a, codes_b):
+        """
+        Get the contrast ratio defined by WCAG, between 1 and 21
+        :param codes_a: a color code, color codes or an `N×4` array
+        :param codes_b: a color code, color codes or an `N×4` array
+        :return: float if both are single color codes, otherwise array of N floats
+        """
+        luminance_a = numpy.asarray(SiColor.luminance(codes_a))
+        luminance_b = numpy.asarray(SiColor.luminance(codes_b))
+        lighter = numpy.maximum(luminance_a, luminance_b)
+        darker = numpy.minimum(luminance_a, luminance_b)
+        result = (lighter + 0.05) / (darker + 0.05)
+        return float(result) if result.ndim == 0 else result
@@ -1 +1,2 @@
-from siui.core.effect.effect import SiQuickEffect
\ No newline at end of file
+from siui.core.effect.effect import SiQuickEffect
+from siui.core.effect.fill import SiColorFill  # noqa: F401
@@ -0,0 +1,93 @@
+import re
+
+from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtGui import QColor, QPainter, QPainterPath
+from PyQt5.QtWidgets import QWidget
+
+# 匹配 border-radius 以及 border-top-left-radius 等单个角的圆角属性
+_radius_pattern = re.compile(r"border(?:-(top|bottom)-(left|right))?-radius\s*:\s*(\d+(?:\.\d+)?)px")
+_corners = {("top", "left"): 0, ("top", "right"): 1, ("bottom", "right"): 2, ("bottom", "left"): 3}
+
+
+class SiColorFill:
+    """
+    Background color with rounded corners which is drawn in paintEvent.\n
+    Animated colors are stored here and painted directly, instead of setting a new style sheet every frame.
+    """
+    def __init__(self):
+        self.color = QColor(0, 0, 0, 0)
+        self.radii = (0, 0, 0, 0)  # 左上、右上、右下、左下
+
+    def setColorValue(self, value):
+        """
+        Set the color of the fill
+        :param value: `array(A, R, G, B)`, the same as SiColor.toArray returns
+        """
+        a, r, g, b = value
+        self.color = QColor(int(r), int(g), int(b), int(a))
+
+    def setBorderRadius(self, *radii):
+        """
+        Set the border radius of the fill
+        :param radii: one radius for all the corners, or four radii of top-left, top-right, bottom-right, bottom-left
+        """
+        if len(radii) == 1:
+            radii = radii * 4
+        if len(radii) != 4:
+            raise ValueError(f"Expected 1 or 4 radii but met {len(radii)}")
+        self.radii = tuple(radii)
+
+    def loadBorderRadius(self, stylesheet: str):
+        """
+        Read border radius from the style sheet, properties are applied in order like Qt does.
+        Corners which are not mentioned keep their current radius.
+        :param stylesheet: style sheet, for example `border-radius: 4px; border-top-left-radius: 2px`
+        """
+        radii = list(self.radii)
+        for vertical, horizontal, value in _radius_pattern.findall(stylesheet):
+            if vertical == "":
+                radii = [float(value)] * 4
+            else:
+                radii[_corners[(vertical, horizontal)]] = float(value)
+        self.radii = tuple(radii)
+
+    def path(self, rect: QRectF):
+        """
+        Get the shape of the fill in the rect
+        :param rect: QRectF
+        :return: QPainterPath
+        """
+        x, y, w, h = rect.x(), rect.y(), rect.width(), rect.height()
+        tl, tr, br, bl = (min(r, w / 2, h / 2) for r in self.radii)
+
+        path = QPainterPath()
+        if tl == tr == br == bl:
+            path.addRoundedRect(rect, tl, tl)
+            return path
+
+        path.moveTo(x + tl, y)
+        path.lineTo(x + w - tr, y)
+        path.arcTo(QRectF(x + w - 2 * tr, y, 2 * tr, 2 * tr), 90, -90)
+        path.lineTo(x + w, y + h - br)
+        path.arcTo(QRectF(x + w - 2 * br, y + h - 2 * br, 2 * br, 2 * br), 0, -90)
+        path.lineTo(x + bl, y + h)
+        path.arcTo(QRectF(x, y + h - 2 * bl, 2 * bl, 2 * bl), 270, -90)
+        path.lineTo(x, y + tl)
+        path.arcTo(QRectF(x, y, 2 * tl, 2 * tl), 180, -90)
+        path.closeSubpath()
+        return path
+
+    def paint(self, widget: QWidget):
+        """
+        Fill the whole widget, call it at the beginning of paintEvent
+        :param widget: the widget being painted
+        """
+        if self.color.alpha() == 0:
+            return
+
+        painter = QPainter(widget)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.color)
+        painter.drawPath(self.path(QRectF(widget.rect())))
+        painter.end()
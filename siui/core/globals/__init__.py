@@ -1 +1,3 @@
-from siui.core.globals.globals import SiGlobal
\ No newline at end of file
+from siui.core.globals.globals import SiGlobal
+from siui.core.globals.stylesheet import flush_style_sheets  # noqa: F401
+from siui.core.globals.theme import SiThemeTransaction  # noqa: F401
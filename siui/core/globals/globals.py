@@ -1,6 +1,8 @@
 import time
 
 from siui.core.color import SiColor
+from siui.core.globals.registry import register_widget, reload_tree
+from siui.core.globals.theme import SiThemeTransaction
 from siui.gui.color_group import DarkColorGroup, BrightColorGroup
 from siui.gui.font import GlobalFontDict
 from siui.gui.icons.parser import SiGlobalIconPack
@@ -47,33 +49,45 @@ class SiliconUIGlobal:
     def loadFonts(self, dictionary):
         SiliconUIGlobal.fonts.update(dictionary)
 
+    def registerWidget(self, widget):
+        """
+        Register a widget which implements reloadStyleSheet, so that it is reloaded together with its window.
+        Silicon widgets register themselves, call it in custom widgets that are not derived from them
+        :param widget: widget
+        """
+        register_widget(widget)
+
     def reloadAllWindowsStyleSheet(self):
         """
-        Call the reloadStyleSheet method in each window and recursively reload the style sheets of all controls in all windows
+        Call the reloadStyleSheet method of each window and of all the registered widgets in them,
+        parents before children. Hidden subtrees are reloaded when they are shown
         """
         for window in self.windows.values():
-            try:
-                window.reloadStyleSheet()
-            except:
-                pass
-            self._reloadWidgetStyleSheet(window)
+            reload_tree(window)
 
     def reloadStyleSheetRecursively(self, widget):
-        """ run reloadStyleSheet() for all children of this widget """
-        try:
-            widget.reloadStyleSheet()
-        except:
-            pass
-        self._reloadWidgetStyleSheet(widget)
-
-    def _reloadWidgetStyleSheet(self, widget):
-        for child in widget.children():
-            self._reloadWidgetStyleSheet(child)
-            try:
-                child.reloadStyleSheet()
-            except:
-                pass
-        return
+        """ run reloadStyleSheet() of this widget and all the registered widgets in it """
+        reload_tree(widget)
+
+    def themeTransaction(self, cross_fade: bool = False):
+        """
+        Create a theme transaction on the global colors and all the windows.
+        Only the widgets reading changed colors are restyled when it commits.
+        :param cross_fade: fade out a snapshot of each visible window after restyling
+        :return: SiThemeTransaction
+        """
+        return SiThemeTransaction(SiliconUIGlobal.colors, SiliconUIGlobal.windows.values(), cross_fade)
+
+    def switchTheme(self, color_group, cross_fade: bool = False):
+        """
+        Overwrite the global colors with the color group, and restyle the affected widgets
+        :param color_group: color group of the new theme, for example BrightColorGroup()
+        :param cross_fade: fade out a snapshot of each visible window after restyling
+        :return: set of names of the changed colors
+        """
+        with self.themeTransaction(cross_fade) as transaction:
+            SiliconUIGlobal.colors.overwrite(color_group)
+        return transaction.changedTokens()
 
 
 class SiGlobal:
@@ -0,0 +1,135 @@
+import weakref
+
+from PyQt5 import sip
+from PyQt5.QtCore import QEvent, QObject
+from PyQt5.QtWidgets import QWidget
+
+from siui.core.globals.stylesheet import batch_style_sheets
+from siui.gui.color_group.color_group import begin_recording, end_recording
+
+# 实现了 reloadStyleSheet 的控件，使用弱引用，控件销毁后自动移除
+_widgets = weakref.WeakSet()
+
+# 每个控件上一次 reloadStyleSheet 时读取的颜色名称
+_widget_tokens = weakref.WeakKeyDictionary()
+
+
+def register_widget(widget):
+    """
+    Register a widget which implements reloadStyleSheet, so that it is reloaded with the tree it belongs to
+    :param widget: widget
+    """
+    _widgets.add(widget)
+
+
+def is_registered(widget):
+    """
+    To check whether the widget is registered
+    :return: bool
+    """
+    return widget in _widgets
+
+
+def reload_tracked(widget):
+    """
+    Run reloadStyleSheet() of the widget and remember which colors it reads,
+    so that theme transactions can skip it if none of them changes
+    :param widget: widget which has reloadStyleSheet method
+    """
+    begin_recording()
+    try:
+        widget.reloadStyleSheet()
+    finally:
+        _widget_tokens[widget] = frozenset(end_recording())
+
+
+def read_tokens(widget):
+    """
+    Get names of the colors the widget read in its last tracked reloadStyleSheet()
+    :return: frozenset, or None if it has never been reloaded by reload_tracked
+    """
+    return _widget_tokens.get(widget)
+
+
+class SiDeferredReloader(QObject):
+    """
+    Reloads the style sheets of hidden subtrees when they are shown
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.members = weakref.WeakKeyDictionary()  # 被隐藏的子树的根 -> 子树中等待显示的控件
+        self.roots = weakref.WeakKeyDictionary()    # 等待显示的控件 -> 所在子树的根
+
+    def defer(self, widget, root):
+        """
+        Reload the tree of root when widget or root is shown for the first time
+        :param widget: root or a registered widget in its tree
+        :param root: root of the hidden subtree
+        """
+        if self.roots.get(widget) is root:
+            return
+        self.members.setdefault(root, weakref.WeakSet()).add(widget)
+        self.roots[widget] = root
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        # Qt 先向子控件发送 Show 事件，再向父控件发送，
+        # 所以在子树中任意控件收到 Show 事件时重载整个子树，使其先于子树中所有的 showEvent
+        if event.type() == QEvent.Show and obj in self.roots:
+            root = self.roots[obj]
+            for widget in self.members.pop(root, ()):
+                self.roots.pop(widget, None)
+                if sip.isdeleted(widget) is False:
+                    widget.removeEventFilter(self)
+            reload_tree(root)
+        return False
+
+
+_deferred_reloader = None
+
+
+def _defer(widget, root):
+    global _deferred_reloader
+    if _deferred_reloader is None:
+        _deferred_reloader = SiDeferredReloader()
+    _deferred_reloader.defer(widget, root)
+
+
+def reload_tree(root, predicate=None):
+    """
+    Reload the style sheets of the root and the registered widgets in its tree, each exactly once,
+    and parents before children. Subtrees which are hidden are skipped, and reloaded when they are shown.
+    :param root: widget
+    :param predicate: function accepts a widget, only the widgets it returns True for are reloaded
+    :return: number of reloaded widgets
+    """
+    if sip.isdeleted(root):
+        return 0
+
+    # 重载时同一个控件的样式表可能被设置多次，批处理使每个控件只应用一次
+    with batch_style_sheets():
+        return _reload_tree(root, predicate)
+
+
+def _reload_tree(root, predicate):
+    reloaded = 0
+    if hasattr(root, "reloadStyleSheet") and (predicate is None or predicate(root)):
+        reload_tracked(root)
+        reloaded += 1
+
+    hidden_root = None
+    # findChildren 按先序遍历返回，父控件总在子控件之前，每个被隐藏的子树都是连续的一段
+    for widget in root.findChildren(QWidget):
+        if widget.isVisibleTo(root) is False:
+            if hidden_root is None or hidden_root.isAncestorOf(widget) is False:
+                hidden_root = widget
+                _defer(widget, widget)
+            elif widget in _widgets:
+                _defer(widget, hidden_root)
+            continue
+
+        if widget in _widgets and (predicate is None or predicate(widget)):
+            reload_tracked(widget)
+            reloaded += 1
+
+    return reloaded
@@ -0,0 +1,174 @@
+import re
+import sys
+
+from PyQt5 import sip
+from PyQt5.QtWidgets import QWidget
+
+from siui.core.color import SiColor
+from siui.gui.color_group.theme_cache import get_theme_cache
+
+
+class SiStyleSheetBatcher:
+    """
+    Style sheets are applied at once by default. Inside a batch, only the latest style sheet set to
+    each widget is recorded, and they are applied together when the outermost batch ends.\n
+    Use it as a context manager through batch_style_sheets()
+    """
+    def __init__(self):
+        self.pending = {}   # 控件 -> 批处理中最后一次设置的样式表
+        self.depth = 0      # 嵌套的批处理层数
+
+    def set(self, widget, stylesheet: str):
+        if self.depth == 0:
+            self._apply(widget, stylesheet)
+        else:
+            self.pending[widget] = stylesheet
+
+    def pendingStyleSheet(self, widget):
+        return self.pending.get(widget)
+
+    def flushWidget(self, widget):
+        stylesheet = self.pending.pop(widget, None)
+        if stylesheet is not None:
+            self._apply(widget, stylesheet)
+
+    def flush(self):
+        # 应用样式表时可能产生新的请求，循环直到全部应用
+        while self.pending:
+            pending, self.pending = self.pending, {}
+            for widget, stylesheet in pending.items():
+                self._apply(widget, stylesheet)
+
+    @staticmethod
+    def _apply(widget, stylesheet):
+        if sip.isdeleted(widget):
+            return
+        if QWidget.styleSheet(widget) != stylesheet:  # 样式表没有变化时不需要重新计算样式
+            QWidget.setStyleSheet(widget, stylesheet)
+
+    def __enter__(self):
+        self.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.depth -= 1
+        if self.depth == 0:
+            self.flush()
+        return False
+
+
+_batcher = SiStyleSheetBatcher()
+
+
+def batch_style_sheets():
+    """
+    Get a context manager, style sheets set to Silicon widgets inside it are applied once when it exits,
+    so each widget is polished once no matter how many times it is restyled. Batches can be nested.\n
+    with batch_style_sheets():
+        SiGlobal.siui.reloadAllWindowsStyleSheet()
+    :return: SiStyleSheetBatcher
+    """
+    return _batcher
+
+
+def set_style_sheet(widget, stylesheet: str):
+    """
+    Set the style sheet of the widget now, or when the batch ends if it is called inside batch_style_sheets()
+    :param widget: widget
+    :param stylesheet: the complete style sheet
+    """
+    _batcher.set(widget, stylesheet)
+
+
+def pending_style_sheet(widget):
+    """
+    Get the style sheet waiting to be applied to the widget
+    :return: style sheet, or None if there isn't one
+    """
+    return _batcher.pendingStyleSheet(widget)
+
+
+def flush_style_sheet(widget):
+    """
+    Apply the style sheet waiting for the widget now, call it before reading style dependent values in a batch
+    :param widget: widget
+    """
+    _batcher.flushWidget(widget)
+
+
+def flush_style_sheets():
+    """
+    Apply all the style sheets waiting now
+    """
+    _batcher.flush()
+
+
+# 样式表模板中的占位符，例如 {TEXT_B}，不会与 QSS 中的 { color: ... } 混淆
+_placeholder_pattern = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+class SiStyleSheetTemplate:
+    """
+    Style sheet declared once with placeholders, like `color: {TEXT_B}`.\n
+    Placeholders named after SiColor tokens are read from the color group, the others are given to render().
+    Each distinct set of values is rendered only once, and every widget using them shares the same interned string.
+    """
+    cache_size = 64  # 每个模板最多保存的渲染结果数量
+
+    def __init__(self, template: str):
+        self.template = template
+        self.parts = _placeholder_pattern.split(template)  # 偶数位置是原文，奇数位置是占位符名称
+        names = dict.fromkeys(self.parts[1::2])
+        self.tokens = tuple(SiColor[name] for name in names if name in SiColor.__members__)
+        self.rendered = {}  # 占位符的值 -> 样式表
+
+    def render(self, color_group, **values):
+        """
+        Render the template with colors of the color group
+        :param color_group: SiColorGroup which provides the color tokens
+        :param values: values of the placeholders which are not color tokens
+        :return: style sheet
+        """
+        key = tuple(color_group.fromToken(token) for token in self.tokens)
+        if values:
+            key += tuple(sorted(values.items()))
+
+        stylesheet = self.rendered.get(key)
+        if stylesheet is None:
+            if len(self.rendered) >= self.cache_size:
+                self.rendered.clear()
+
+            # 启用主题缓存时，先使用以前运行时渲染的结果
+            theme_cache = get_theme_cache()
+            stylesheet = None if theme_cache is None else theme_cache.lookup(self.template, key)
+            if stylesheet is None:
+                stylesheet = self._format(key)
+                if theme_cache is not None:
+                    theme_cache.store(self.template, key, stylesheet)
+
+            stylesheet = sys.intern(stylesheet)
+            self.rendered[key] = stylesheet
+        return stylesheet
+
+    def _format(self, key):
+        mapping = {token.name: code for token, code in zip(self.tokens, key)}
+        mapping.update(key[len(self.tokens):])
+        parts = list(self.parts)
+        for index in range(1, len(parts), 2):
+            parts[index] = str(mapping[parts[index]])
+        return "".join(parts)
+
+
+_templates = {}
+
+
+def style_template(template: str) -> SiStyleSheetTemplate:
+    """
+    Get the shared SiStyleSheetTemplate of the template, create it if it doesn't exist.
+    Declare templates once at module level, and render them in reloadStyleSheet
+    :param template: style sheet with placeholders, like `color: {TEXT_B}`
+    :return: SiStyleSheetTemplate
+    """
+    if template not in _templates:
+        _templates[template] = SiStyleSheetTemplate(template)
+    return _templates[template]
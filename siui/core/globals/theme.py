@@ -0,0 +1,130 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import QWidget
+
+from siui.core.animation import SiExpAnimation
+from siui.core.globals.registry import read_tokens, reload_tree
+
+
+class SiThemeFadeOverlay(QWidget):
+    """
+    Snapshot of a window before the theme changes, which fades out above the window
+    """
+    def __init__(self, window):
+        super().__init__(window)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+
+        self.pixmap = window.grab()
+        self.opacity = 1.0
+
+        self.animation = SiExpAnimation(self)
+        self.animation.setFactor(1/6)
+        self.animation.setBias(0.02)
+        self.animation.setCurrent(1)
+        self.animation.setTarget(0)
+        self.animation.ticked.connect(self._on_ticked)
+        self.animation.finished.connect(self.deleteLater)
+
+        self.setGeometry(window.rect())
+        self.raise_()
+        self.show()
+
+    def _on_ticked(self, opacity):
+        self.opacity = max(opacity, 0)
+        self.update()
+
+    def start(self):
+        self.raise_()
+        self.animation.start()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setOpacity(self.opacity)
+        painter.drawPixmap(0, 0, self.pixmap)
+
+
+class SiThemeTransaction:
+    """
+    Change colors of a color group, then restyle only the widgets which read the changed colors
+    in their last reloadStyleSheet(). Widgets that have never been reloaded by reload_tracked are always restyled.\n
+    Use it as a context manager:\n
+    with SiThemeTransaction(SiGlobal.siui.colors, SiGlobal.siui.windows.values()):
+        SiGlobal.siui.colors.overwrite(BrightColorGroup())
+    """
+    def __init__(self, color_group, windows, cross_fade: bool = False):
+        """
+        :param color_group: the color group to be changed
+        :param windows: top level widgets whose children are restyled
+        :param cross_fade: fade out a snapshot of each visible window after restyling
+        """
+        self.color_group = color_group
+        self.windows = list(windows)
+        self.cross_fade = cross_fade
+
+        self.before = None
+        self.overlays = []
+        self.changed = set()
+        self.restyled = 0
+
+    def begin(self):
+        """
+        Remember the current colors, call it before changing colors
+        """
+        self.before = self.color_group.snapshot()
+        if self.cross_fade:
+            self.overlays = [SiThemeFadeOverlay(window) for window in self.windows if window.isVisible()]
+
+    def commit(self):
+        """
+        Restyle the widgets affected by the color changes since begin()
+        :return: set of names of the changed colors
+        """
+        after = self.color_group.snapshot()
+        self.restyled = 0
+        self.changed = self.before.diff(after)
+
+        if self.changed:
+            for window in self.windows:
+                self.restyled += reload_tree(window, self._isAffected)
+
+        for overlay in self.overlays:
+            overlay.start()
+        self.overlays = []
+        return self.changed
+
+    def rollback(self):
+        """
+        Give up the transaction without restyling anything. Colors are not restored
+        """
+        for overlay in self.overlays:
+            overlay.deleteLater()
+        self.overlays = []
+
+    def changedTokens(self):
+        """
+        Get names of the colors changed in the last commit
+        :return: set of names
+        """
+        return self.changed
+
+    def restyledCount(self):
+        """
+        Get how many widgets were restyled in the last commit
+        :return: int
+        """
+        return self.restyled
+
+    def _isAffected(self, widget):
+        tokens = read_tokens(widget)
+        return tokens is None or tokens.isdisjoint(self.changed) is False
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
@@ -1,3 +1,5 @@
 from .color_group import SiColorGroup
+from .palette import SiPalette  # noqa: F401
+from .theme_cache import SiThemeCache, enable_theme_cache, get_theme_cache  # noqa: F401
 from .dark import DarkColorGroup
 from .bright import BrightColorGroup
\ No newline at end of file
@@ -1,17 +1,56 @@
+import itertools
 
 from siui.core.color import SiColor
+from siui.gui.color_group.palette import SiPalette
+
+# 颜色组每次变化时从这里取得新的版本号，所以任何变化之后的版本号都大于之前所有的版本号
+_generations = itertools.count(1)
+
+
+# 正在记录被读取的颜色的集合，读取记录在栈顶的集合中
+_recorders = []
+
+
+def begin_recording():
+    """
+    Start recording names of the colors read from any color group, recordings can be nested
+    """
+    _recorders.append(set())
+
+
+def end_recording():
+    """
+    Stop the latest recording, the names are also added to the recording outside of it
+    :return: set of color names read since the recording began
+    """
+    names = _recorders.pop()
+    if _recorders:
+        _recorders[-1].update(names)
+    return names
 
 
 class SiColorGroup:
     def __getitem__(self, item):
-        return self.colors[item]
+        if _recorders:
+            _recorders[-1].add(item)
+        if item in self.colors or self.palette is None:
+            return self.colors[item]
+        code = self.palette.code(SiColor[item]) if item in SiColor.__members__ else None
+        if code is None:
+            raise KeyError(item)
+        return code
 
     def __init__(self,
                  overwrite=None,
-                 reference=None):
+                 reference=None,
+                 palette=None):
 
         self.valid_state = True
+        self.palette = palette                  # 预编译的 SiPalette，colors 中的颜色叠加在它上面
         self.colors = {}
+        self.generation = next(_generations)    # 本颜色组的版本号，变化时更新
+        self.resolved = {}                      # 已解析的颜色，键为 SiColor，包括来自引用的颜色
+        self.resolved_generation = None         # 缓存对应的 chainGeneration()
 
         if overwrite is not None:
             self.overwrite(overwrite)
@@ -24,14 +63,38 @@ class SiColorGroup:
 
     def assign(self, token, code):
         self.colors[token.name] = code
+        self._invalidate()
 
     def remove(self, token):
         if token.name in self.colors.keys():
             self.colors.pop(token.name)
+            self._invalidate()
+        if self.palette is not None and self.palette.isAssigned(token):
+            self.palette = self.palette.overlay({token: None})
+            self._invalidate()
 
     def fromToken(self, token):
-        if token.name in self.colors.keys() and self.valid_state:
-            return self.colors[token.name]
+        if _recorders:
+            _recorders[-1].add(token.name)
+
+        generation = self.chainGeneration()
+        if self.resolved_generation != generation:
+            self.resolved.clear()
+            self.resolved_generation = generation
+
+        code = self.resolved.get(token)
+        if code is None:
+            code = self._resolve(token)
+            self.resolved[token] = code
+        return code
+
+    def _resolve(self, token):
+        name = token.name
+        if self.valid_state:
+            if name in self.colors:
+                return self.colors[name]
+            if self.palette is not None and self.palette.isAssigned(token):
+                return self.palette.code(token)
         if self.reference is None:
             raise ValueError(
                 f"Color under token {token.name} is not assigned yet either in this group or in its reference\n"
@@ -40,20 +103,63 @@ class SiColorGroup:
         else:
             return self.reference.fromToken(token)
 
+    def _invalidate(self):
+        self.generation = next(_generations)
+
+    def chainGeneration(self):
+        """
+        Get the latest generation of this group and its references.
+        It grows whenever this group or any group in its reference chain changes, and only then
+        :return: int
+        """
+        generation, group = self.generation, self.reference
+        while group is not None:
+            if group.generation > generation:
+                generation = group.generation
+            group = group.reference
+        return generation
+
     def isAssigned(self, token):
+        assigned = token.name in self.colors.keys() or (self.palette is not None and self.palette.isAssigned(token))
         if self.reference is None:
-            return token.name in self.colors.keys()
+            return assigned
         else:
-            return ((token.name in self.colors.keys()) and self.valid_state) or self.reference.isAssigned(token)
+            return (assigned and self.valid_state) or self.reference.isAssigned(token)
 
     def overwrite(self, color_group):
+        if color_group.palette is not None:
+            # 被新调色板覆盖的颜色不再保留
+            self.colors = {name: code for name, code in self.colors.items()
+                           if color_group.palette.code(SiColor[name]) is None}
+            if self.palette is None:
+                self.palette = color_group.palette
+            else:
+                self.palette = self.palette.overlay(color_group.palette)
         self.colors.update(color_group.colors)
+        self._invalidate()
+
+    def snapshot(self):
+        """
+        Get all the colors this group resolves to, including the ones from its references
+        :return: SiPalette
+        """
+        if self.reference is None and not self.colors and self.palette is not None:
+            return self.palette
+        colors = {}
+        for token in SiColor:
+            try:
+                colors[token] = self.fromToken(token)
+            except ValueError:
+                continue
+        return SiPalette.fromMapping(colors)
 
     def setReference(self, color_group):
         self.reference = color_group
+        self._invalidate()
 
     def setValid(self, state):
         self.valid_state = state
+        self._invalidate()
 
     def isValid(self):
         return self.valid_state
@@ -0,0 +1,137 @@
+import hashlib
+from array import array
+
+from siui.core.color import SiColor
+
+# 调色板按 SiColor 的值排列，要求枚举值从 1 开始连续
+_tokens = tuple(SiColor)
+if [token.value for token in _tokens] != list(range(1, len(_tokens) + 1)):
+    raise RuntimeError("SiColor values must be consecutive integers starting from 1")
+
+
+class SiPalette:
+    """
+    Frozen table of colors indexed by SiColor.\n
+    It stores the color code and the packed ARGB integer of each token, so a lookup is a single index operation.
+    Palettes never change once created, layering one on another creates a new palette.
+    """
+    __slots__ = ("codes", "values", "digest_")
+
+    def __init__(self, codes):
+        """
+        :param codes: color codes or None for unassigned tokens, in the order of SiColor values
+        """
+        codes = tuple(codes)
+        if len(codes) != len(_tokens):
+            raise ValueError(f"Expected {len(_tokens)} codes but met {len(codes)}")
+
+        object.__setattr__(self, "codes", codes)
+        object.__setattr__(self, "values", array("I", (0 if code is None else SiColor.toInt(code) for code in codes)))
+        object.__setattr__(self, "digest_", None)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("SiPalette is frozen, use overlay() to create a new one")
+
+    @classmethod
+    def fromMapping(cls, colors: dict):
+        """
+        Create a palette from a dict
+        :param colors: dict whose keys are SiColor tokens or their names, and values are color codes
+        :return: SiPalette
+        """
+        codes = [None] * len(_tokens)
+        for token, code in colors.items():
+            if isinstance(token, str):
+                token = SiColor[token]
+            codes[token.value - 1] = code
+        return cls(codes)
+
+    def code(self, token):
+        """
+        Get the color code of the token
+        :param token: SiColor
+        :return: color code, or None if it is not assigned
+        """
+        return self.codes[token.value - 1]
+
+    def argb(self, token):
+        """
+        Get the color of the token as a packed integer `0xAARRGGBB`
+        :param token: SiColor
+        :return: int, or None if it is not assigned
+        """
+        index = token.value - 1
+        return None if self.codes[index] is None else self.values[index]
+
+    def isAssigned(self, token):
+        return self.codes[token.value - 1] is not None
+
+    def tokens(self):
+        """
+        Get the tokens assigned in this palette
+        :return: list of SiColor
+        """
+        return [token for token, code in zip(_tokens, self.codes) if code is not None]
+
+    def overlay(self, other):
+        """
+        Layer colors on top of this palette
+        :param other: SiPalette, or dict like fromMapping accepts. In a dict, None removes the color
+        :return: new SiPalette, or one of the two if nothing needs to be merged
+        """
+        if isinstance(other, SiPalette):
+            if all(upper is not None or lower is None for lower, upper in zip(self.codes, other.codes)):
+                return other  # 覆盖了这个调色板的所有颜色
+            return SiPalette(lower if upper is None else upper for lower, upper in zip(self.codes, other.codes))
+
+        codes = list(self.codes)
+        for token, code in other.items():
+            if isinstance(token, str):
+                token = SiColor[token]
+            codes[token.value - 1] = code
+        return SiPalette(codes)
+
+    def diff(self, other):
+        """
+        Get names of the tokens whose colors differ between two palettes
+        :param other: SiPalette
+        :return: set of names
+        """
+        if other is self:
+            return set()
+        return {token.name for token, a, b in zip(_tokens, self.codes, other.codes) if a != b}
+
+    def toDict(self):
+        """
+        Serialize this palette
+        :return: dict of token names and color codes, unassigned tokens are left out
+        """
+        return {token.name: code for token, code in zip(_tokens, self.codes) if code is not None}
+
+    @classmethod
+    def fromDict(cls, colors: dict):
+        """
+        Deserialize a palette created by toDict, names which are no longer in SiColor are ignored
+        :param colors: dict of token names and color codes
+        :return: SiPalette
+        """
+        return cls.fromMapping({name: code for name, code in colors.items() if name in SiColor.__members__})
+
+    def digest(self):
+        """
+        Get the hash of the content of this palette, which is stable between runs
+        :return: hex string
+        """
+        if self.digest_ is None:
+            content = "\n".join(f"{name}={code}" for name, code in self.toDict().items())
+            object.__setattr__(self, "digest_", hashlib.sha1(content.encode()).hexdigest())
+        return self.digest_
+
+    def __len__(self):
+        return len(self.codes) - self.codes.count(None)
+
+    def __eq__(self, other):
+        return isinstance(other, SiPalette) and self.codes == other.codes
+
+    def __hash__(self):
+        return hash(self.codes)
@@ -0,0 +1,246 @@
+import atexit
+import hashlib
+import json
+import marshal
+import os
+import sys
+import tempfile
+import zlib
+from importlib import metadata
+
+from .palette import SiPalette
+
+cache_format = 1        # 缓存文件的格式，格式变化时旧文件被忽略
+max_palettes = 8        # 最多为多少个调色板保存样式表
+
+
+def library_version():
+    """
+    Get the version of the library, which is a part of the cache key.
+    The source files are hashed into it as well, so that a source checkout or an editable install,
+    whose version stays the same while the code changes, does not use style sheets of older code
+    :return: str
+    """
+    try:
+        version = metadata.version("PyQt-SiliconUI")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return f"{version}+{source_digest()}"
+
+
+def source_digest(root: str = None):
+    """
+    Hash the paths, sizes and modification times of the source files, without reading them
+    :param root: directory of the sources, the siui package by default
+    :return: str
+    """
+    if root is None:
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    digest = hashlib.sha1()
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name != "__pycache__")
+        for filename in sorted(filenames):
+            if filename.endswith(".py"):
+                path = os.path.join(directory, filename)
+                stat = os.stat(path)
+                digest.update(f"{os.path.relpath(path, root)}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()[:16]
+
+
+def user_cache_dir():
+    """
+    Get the directory for the cache files of this library, following the conventions of each platform
+    :return: path
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "siui")
+
+
+def _to_key(value):
+    # JSON 把元组保存为列表，读取时还原成元组，使其可以作为字典的键
+    return tuple(_to_key(item) for item in value) if isinstance(value, list) else value
+
+
+class SiThemeCache:
+    """
+    Palettes and rendered style sheet templates saved between runs.\n
+    The whole file is read once when loading, and written when the process exits if anything is added.
+    Style sheets are stored under the content hash of the global palette they were rendered with,
+    so a changed palette simply finds nothing and renders again. Files of other library versions are ignored.
+    """
+    def __init__(self, path: str = None):
+        """
+        :param path: path of the cache file, a file in user_cache_dir() is used by default
+        """
+        self.path = os.path.join(user_cache_dir(), "theme_cache.bin") if path is None else path
+        self.version = library_version()
+
+        self.palettes = {}      # 调色板名称 -> 构建函数的摘要和解析后的颜色
+        self.templates = {}     # 调色板内容摘要 -> {模板: {颜色: 样式表}}
+        self.dirty = False
+
+        self.digest_ = None
+        self.digest_generation = None
+
+    def load(self):
+        """
+        Read the cache file. A missing, broken or outdated file leaves the cache empty
+        :return: whether the file is loaded
+        """
+        try:
+            with open(self.path, "rb") as file:
+                data = json.loads(zlib.decompress(file.read()))
+        except (OSError, ValueError, zlib.error):
+            return False
+
+        if data.get("format") != cache_format or data.get("version") != self.version:
+            return False
+
+        self.palettes = data.get("palettes", {})
+        self.templates = {
+            digest: {template: {_to_key(key): stylesheet for key, stylesheet in entries}
+                     for template, entries in templates.items()}
+            for digest, templates in data.get("templates", {}).items()
+        }
+        return True
+
+    def save(self):
+        """
+        Write the cache file if anything is added since it is loaded
+        :return: whether the file is written
+        """
+        if self.dirty is False:
+            return False
+
+        # 只保留最近使用的几个调色板，字典按插入顺序排列
+        digests = list(self.templates)[-max_palettes:]
+        data = {
+            "format": cache_format,
+            "version": self.version,
+            "palettes": self.palettes,
+            "templates": {
+                digest: {template: list(entries.items()) for template, entries in self.templates[digest].items()}
+                for digest in digests
+            },
+        }
+
+        temp_path = None
+        try:
+            content = zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, exist_ok=True)
+            # 每次写入使用不同的临时文件，再整体替换，保证其他进程不会读到写了一半的文件
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(temp_path, self.path)
+        except (OSError, TypeError, ValueError):
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            return False
+
+        self.dirty = False
+        return True
+
+    def palette(self, name: str, builder):
+        """
+        Get a palette built by the builder, from the cache if the builder is not changed
+        :param name: name of the palette
+        :param builder: function without arguments which returns SiPalette
+        :return: SiPalette
+        """
+        code = builder.__code__
+        source = hashlib.sha1(marshal.dumps((code.co_code, code.co_consts, code.co_names))).hexdigest()
+
+        entry = self.palettes.get(name)
+        if entry is not None and entry.get("source") == source:
+            return SiPalette.fromDict(entry["colors"])
+
+        palette = builder()
+        self.palettes[name] = {"source": source, "colors": palette.toDict()}
+        self.dirty = True
+        return palette
+
+    def _currentTemplates(self):
+        # 全局颜色变化时重新计算摘要，颜色没有变化时只比较一次整数
+        from siui.core.globals import SiGlobal
+
+        generation = SiGlobal.siui.colors.chainGeneration()
+        if self.digest_generation != generation:
+            self.digest_ = SiGlobal.siui.colors.snapshot().digest()
+            self.digest_generation = generation
+            self.templates[self.digest_] = self.templates.pop(self.digest_, {})  # 移到末尾，表示最近使用过
+        return self.templates[self.digest_]
+
+    def lookup(self, template: str, key):
+        """
+        Get a style sheet rendered in previous runs
+        :param template: source of the template
+        :param key: values of the placeholders
+        :return: style sheet, or None if it is not cached
+        """
+        entries = self._currentTemplates().get(template)
+        return None if entries is None else entries.get(key)
+
+    def store(self, template: str, key, stylesheet: str):
+        """
+        Save a rendered style sheet, it is written to the file when the process exits
+        :param template: source of the template
+        :param key: values of the placeholders
+        :param stylesheet: rendered style sheet
+        """
+        self._currentTemplates().setdefault(template, {})[key] = stylesheet
+        self.dirty = True
+
+
+_theme_cache = None
+
+
+def enable_theme_cache(path: str = None):
+    """
+    Load the theme cache and use it from now on, it is saved when the process exits.
+    Icon packages loaded afterwards are also compiled into user_cache_dir() and memory-mapped.
+    It can also be enabled before importing siui by setting the environment variable SIUI_THEME_CACHE
+    to 1 or to the path of the cache file, so that the built-in palettes and icon packages use it as well
+    :param path: path of the cache file, a file in user_cache_dir() is used by default
+    :return: SiThemeCache
+    """
+    global _theme_cache
+    if _theme_cache is None:
+        _theme_cache = SiThemeCache(path)
+        _theme_cache.load()
+        atexit.register(_theme_cache.save)
+    return _theme_cache
+
+
+def get_theme_cache():
+    """
+    Get the theme cache in use
+    :return: SiThemeCache, or None if it is not enabled
+    """
+    return _theme_cache
+
+
+def cached_palette(name: str, builder):
+    """
+    Build a palette, or load it from the theme cache if it is enabled and the builder is not changed
+    :param name: name of the palette
+    :param builder: function without arguments which returns SiPalette
+    :return: SiPalette
+    """
+    if _theme_cache is None:
+        return builder()
+    return _theme_cache.palette(name, builder)
+
+
+if os.environ.get("SIUI_THEME_CACHE", "0") not in ("", "0"):
+    enable_theme_cache(None if os.environ["SIUI_THEME_CACHE"] == "1" else os.environ["SIUI_THEME_CACHE"])
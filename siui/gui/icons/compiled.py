@@ -0,0 +1,233 @@
+import argparse
+import mmap
+import os
+import re
+import struct
+import tempfile
+import zlib
+
+from siui.gui.color_group.theme_cache import user_cache_dir
+from siui.gui.icons.parser import SiIconFile
+
+# 编译后的图标包格式：
+#   文件头  魔数, 格式版本, 图标数量, 标志
+#   条目表  按原文件中的顺序，每个条目为 名称偏移, 名称长度, 数据偏移, 数据长度
+#   排序表  按名称的 UTF-8 字节排序的条目序号，用于二分查找
+#   名称    所有名称的 UTF-8 字节
+#   数据    所有图标的 SVG 源码，可以分别用 zlib 压缩
+_magic = b"SIICONS\0"
+_header = struct.Struct("<8sIII")
+_entry = struct.Struct("<IIII")
+_order = struct.Struct("<I")
+
+format_version = 1
+flag_compressed = 1
+
+
+def compile_icon_file(source: str, target: str, compress: bool = False):
+    """
+    Convert an .icons file into the compiled format, which is opened with SiCompiledIconFile
+    :param source: path of the .icons file
+    :param target: path of the compiled file, it is replaced atomically
+    :param compress: compress each SVG source with zlib, which makes the file smaller but lookups slower
+    :return: number of icons
+    """
+    icon_file = SiIconFile(source)
+    names = list(icon_file.names())
+    encoded_names = [name.encode("utf-8") for name in names]
+    data = [icon_file.read(name).encode("utf-8") for name in names]
+    if compress:
+        data = [zlib.compress(item, 9) for item in data]
+
+    count = len(names)
+    names_offset = _header.size + _entry.size * count + _order.size * count
+    data_offset = names_offset + sum(len(name) for name in encoded_names)
+
+    entries = []
+    name_position, data_position = names_offset, data_offset
+    for name, item in zip(encoded_names, data):
+        entries.append(_entry.pack(name_position, len(name), data_position, len(item)))
+        name_position += len(name)
+        data_position += len(item)
+    order = sorted(range(count), key=lambda index: encoded_names[index])
+
+    # 每次写入使用不同的临时文件，再整体替换，其他进程不会读到写了一半的文件
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(target)),
+                                     prefix=os.path.basename(target), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(_header.pack(_magic, format_version, count, flag_compressed if compress else 0))
+            file.write(b"".join(entries))
+            file.write(b"".join(_order.pack(index) for index in order))
+            file.write(b"".join(encoded_names))
+            file.write(b"".join(data))
+        os.replace(temp_path, target)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return count
+
+
+def compiled_cache_path(source: str):
+    """
+    Get the path where the compiled copy of an .icons file is cached, it changes when the source file changes
+    :param source: path of the .icons file
+    :return: path
+    """
+    stat = os.stat(source)
+    name = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(user_cache_dir(), "icons", f"{name}-{stat.st_size}-{stat.st_mtime_ns}.siicons")
+
+
+def prune_compiled_cache(path: str):
+    """
+    Remove the compiled copies of older versions of the same .icons file, which are never used again
+    :param path: path of the current compiled copy, given by compiled_cache_path()
+    :return: number of files removed
+    """
+    directory, filename = os.path.split(path)
+    match = re.fullmatch(r"(.*)-\d+-\d+\.siicons", filename)
+    if match is None:
+        return 0  # 不是 compiled_cache_path() 给出的路径
+    pattern = re.compile(re.escape(match.group(1)) + r"-\d+-\d+\.siicons")
+
+    removed = 0
+    for other in os.listdir(directory):
+        if other != filename and pattern.fullmatch(other):
+            try:
+                os.remove(os.path.join(directory, other))
+                removed += 1
+            except OSError:
+                pass  # 其他进程可能仍在使用，下次再删除
+    return removed
+
+
+class SiCompiledIconFile:
+    """
+    An icon package file in the compiled format, opened with mmap on first use.\n
+    Names are found by binary search in the file, and SVG sources are read from the shared pages,
+    so processes using the same file share its memory through the page cache.
+    If a source .icons file is given, it is compiled into the user cache directory when the compiled
+    file is missing, replacing the copies of its older versions, and read as a text file if that fails.
+    """
+    def __init__(self, path: str = None, source: str = None):
+        """
+        :param path: path of the compiled file, compiled_cache_path(source) is used if it is None
+        :param source: path of the .icons file to compile from, None if the compiled file always exists
+        """
+        self.path = path
+        self.source = source
+        self.mmap_ = None
+        self.fallback = None  # 无法使用编译后的文件时，改为读取源文件
+        self.count = 0
+        self.compressed = False
+        self.loaded = {}
+
+    def _open(self):
+        if self.mmap_ is not None or self.fallback is not None:
+            return
+
+        try:
+            if self.path is None:
+                self.path = compiled_cache_path(self.source)
+            if self.source is not None and os.path.isfile(self.path) is False:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                compile_icon_file(self.source, self.path)
+                prune_compiled_cache(self.path)
+            self._map()
+        except (OSError, ValueError):
+            if self.source is None:
+                raise
+            self.fallback = SiIconFile(self.source)
+
+    def _map(self):
+        with open(self.path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapped) < _header.size:
+            mapped.close()
+            raise ValueError(f"{self.path} is not a compiled icon package")
+        magic, version, count, flags = _header.unpack_from(mapped, 0)
+        if magic != _magic or version != format_version:
+            mapped.close()
+            raise ValueError(f"{self.path} is not a compiled icon package of version {format_version}")
+
+        self.mmap_ = mapped
+        self.count = count
+        self.compressed = bool(flags & flag_compressed)
+
+    def _entry(self, index):
+        return _entry.unpack_from(self.mmap_, _header.size + _entry.size * index)
+
+    def _name(self, index):
+        name_offset, name_length, _, _ = self._entry(index)
+        return self.mmap_[name_offset:name_offset + name_length]
+
+    def _find(self, name):
+        # 在排序表中二分查找，不需要在内存中建立索引
+        key = name.encode("utf-8")
+        order_offset = _header.size + _entry.size * self.count
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            index = _order.unpack_from(self.mmap_, order_offset + _order.size * middle)[0]
+            current = self._name(index)
+            if current == key:
+                return index
+            if current < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def readBytes(self, name):
+        """
+        Get the stored bytes of an icon without copying them
+        :param name: name of the icon
+        :return: memoryview of the mapped file, compressed if the file is compressed
+        """
+        self._open()
+        if self.fallback is not None:
+            return memoryview(self.fallback.read(name).encode("utf-8"))
+        index = self._find(name)
+        if index is None:
+            raise KeyError(name)
+        _, _, data_offset, data_length = self._entry(index)
+        return memoryview(self.mmap_)[data_offset:data_offset + data_length]
+
+    def read(self, name):
+        """
+        Get the SVG source of an icon
+        :param name: name of the icon
+        :return: str
+        """
+        self._open()
+        if self.fallback is not None:
+            return self.fallback.read(name)
+
+        data = self.loaded.get(name)
+        if data is None:
+            raw = self.readBytes(name)
+            data = zlib.decompress(raw).decode("utf-8") if self.compressed else str(raw, "utf-8")
+            self.loaded[name] = data
+        return data
+
+    def __contains__(self, name):
+        self._open()
+        if self.fallback is not None:
+            return name in self.fallback
+        return self._find(name) is not None
+
+    def names(self):
+        self._open()
+        if self.fallback is not None:
+            return self.fallback.names()
+        return [self._name(index).decode("utf-8") for index in range(self.count)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert .icons files into the compiled icon package format")
+    parser.add_argument("source", help="path of the .icons file")
+    parser.add_argument("target", help="path of the compiled file")
+    parser.add_argument("--compress", action="store_true", help="compress each icon with zlib")
+    args = parser.parse_args()
+    print(f"{compile_icon_file(args.source, args.target, args.compress)} icons written to {args.target}")  # noqa: T201
@@ -1,4 +1,103 @@
 import os
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from siui.gui.icons.raster import get_icon_raster_cache
+
+colorized_cache_size = 1024  # 最多保存多少个着色后的 SVG
+
+
+class SiIconFile:
+    """
+    An icon package file which is indexed on first use.\n
+    Only the name, offset and length of each icon are kept, the SVG source is read when it is asked for.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.index_ = None  # 图标名称 -> (偏移, 长度)
+        self.loaded = {}    # 已经读取过的图标
+
+    def index(self):
+        """
+        Get the index of this file, build it if it doesn't exist
+        :return: dict, name -> (offset, length)
+        """
+        if self.index_ is None:
+            self.index_ = self._build_index()
+        return self.index_
+
+    def _build_index(self):
+        index = {}
+        offset = 0
+        with open(self.path, "rb") as file:
+            for line in file:
+                start, offset = offset, offset + len(line)
+                if line[0:2] == b"##" or line.strip() == b"":
+                    continue
+
+                separator = line.find(b"////")
+                if separator == -1:
+                    raise ValueError(f"Invalid line in {self.path} at offset {start}")
+                name = line[:separator].lstrip().decode("utf-8")
+                data_start = separator + 4
+                index[name] = (start + data_start, len(line.rstrip()) - data_start)
+        return index
+
+    def read(self, name):
+        """
+        Get the SVG source of an icon
+        :param name: name of the icon
+        :return: str
+        """
+        data = self.loaded.get(name)
+        if data is None:
+            offset, length = self.index()[name]
+            with open(self.path, "rb") as file:
+                file.seek(offset)
+                data = file.read(length).decode("utf-8")
+            self.loaded[name] = data
+        return data
+
+    def __contains__(self, name):
+        return name in self.index()
+
+    def names(self):
+        return self.index().keys()
+
+
+class SiIconDict(Mapping):
+    """
+    Read-only dict of icon names and SVG sources, which reads icon files on demand.\n
+    It is made of layers of icon files and dicts, later layers override the earlier ones like dict.update does.
+    """
+    def __init__(self):
+        self.layers = []
+
+    def addFile(self, icon_file):
+        self.layers.append(icon_file)
+
+    def __setitem__(self, name, data):
+        if not self.layers or not isinstance(self.layers[-1], dict):
+            self.layers.append({})
+        self.layers[-1][name] = data
+
+    def __getitem__(self, name):
+        for layer in reversed(self.layers):
+            if name in layer:
+                return layer[name] if isinstance(layer, dict) else layer.read(name)
+        raise KeyError(name)
+
+    def __contains__(self, name):
+        return any(name in layer for layer in self.layers)
+
+    def __iter__(self):
+        names = {}
+        for layer in self.layers:
+            names.update(dict.fromkeys(layer if isinstance(layer, dict) else layer.names()))
+        return iter(names)
+
+    def __len__(self):
+        return sum(1 for _ in self)
 
 
 class SiGlobalIconPack:
@@ -8,15 +107,20 @@ class SiGlobalIconPack:
     def __init__(self):
         self.default_color = None
 
-        self.icons = {}
+        # 着色后的 SVG，键为 (图标名称, 颜色) 或 (SVG 源码, 颜色)，按最近使用排序
+        self.colorized = OrderedDict()
+
+        self.icons = SiIconDict()
         self.icons_classified = {
-            "__unclassified__": {}
+            "__unclassified__": SiIconDict()
         }
 
         # load internal icon packages
         self.reload_internals()
 
     def set_default_color(self, code):
+        if code != self.default_color:
+            self.colorized.clear()
         self.default_color = code
 
     def reload_internals(self):
@@ -26,41 +130,82 @@ class SiGlobalIconPack:
                 self.load_from_file(full_path)
 
     def load_from_file(self, path):
+        """
+        Add an icon package file, it is opened when an icon is asked for for the first time.
+        Compiled files are memory-mapped. .icons files are read as text, or compiled into the user cache directory
+        and memory-mapped if the theme cache is enabled, since both write files there
+        """
+        from siui.gui.color_group.theme_cache import get_theme_cache
+        from siui.gui.icons.compiled import SiCompiledIconFile  # compiled 依赖本模块
+
         class_name = os.path.basename(path)
         self.append_class(class_name)
-        with open(path, encoding="utf-8") as file:
-            for line in file.readlines():
-                if line[0:2] == "##":
-                    continue
-                if line.strip() == "":
-                    continue
 
-                line = line.strip()
-                icon_name, icon_data = line.split("////")
-                self.append(icon_name, icon_data, class_name)
+        if path.endswith(".siicons"):
+            icon_file = SiCompiledIconFile(path)
+        elif get_theme_cache() is not None:
+            icon_file = SiCompiledIconFile(source=path)
+        else:
+            icon_file = SiIconFile(path)
+        self.icons.addFile(icon_file)
+        self.icons_classified[class_name].addFile(icon_file)
+        self.colorized.clear()  # 新的文件可能覆盖已经着色过的图标
 
     def append_class(self, class_name, force=False):
         if class_name in self.icons_classified.keys() and (force is False):
             raise ValueError("Class name {} is already exist.".format(class_name))
-        self.icons_classified[class_name] = {}
+        self.icons_classified[class_name] = SiIconDict()
 
     def append(self, name, data, class_name: str = "__unclassified__"):
         self.icons[name] = data
         self.icons_classified[class_name][name] = data
+        self.colorized.clear()
 
     def get(self, name, color_code: str = None):
+        """
+        Get an icon filled with the color, the same bytes object is returned for the same name and color
+        :param name: name of the icon
+        :param color_code: color code, the default color is used if it is None
+        :return: bytes
+        """
         color_code = self.default_color if color_code is None else color_code
-        return self.icons[name].replace("<<<COLOR_CODE>>>", color_code).encode()
+        return self._colorized(("name", name, color_code), name, color_code)
+
+    def get_pixmap(self, name, width: int, height: int, color_code: str = None, device_pixel_ratio: float = 1.0):
+        """
+        Get an icon rasterized in the size, from the process-wide raster cache
+        :param name: name of the icon
+        :param width: logical width
+        :param height: logical height
+        :param color_code: color code, the default color is used if it is None
+        :param device_pixel_ratio: device pixel ratio of the screen to draw on
+        :return: QPixmap
+        """
+        return get_icon_raster_cache().pixmap(self.get(name, color_code), width, height, device_pixel_ratio)
 
     def get_from_data(self, data, color_code: str = None):
         color_code = self.default_color if color_code is None else color_code
-        return data.replace("<<<COLOR_CODE>>>", color_code).encode()
+        return self._colorized(("data", data, color_code), None, color_code, data)
+
+    def _colorized(self, key, name, color_code, data=None):
+        svg = self.colorized.get(key)
+        if svg is not None:
+            self.colorized.move_to_end(key)
+            return svg
+
+        data = self.icons[name] if data is None else data
+        svg = data.replace("<<<COLOR_CODE>>>", color_code).encode()
+        self.colorized[key] = svg
+        if len(self.colorized) > colorized_cache_size:
+            self.colorized.popitem(last=False)
+        return svg
 
     def get_dict(self, class_name=None):
         """
         Get dictionary of an icon package.
         If class name is assigned, returns the specific package dictionary.
         If class name is None, returns a dictionary that contains all icons.
+        Icons are read from the package files when their values are accessed.
         """
         if class_name is None:
             return self.icons
@@ -0,0 +1,115 @@
+from collections import OrderedDict
+
+from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtGui import QPainter, QPixmap
+
+from siui.gui.icons.renderer import get_svg_renderer_pool
+
+
+class SiIconRasterCache:
+    """
+    Process-wide cache of rasterized SVG icons.\n
+    Each distinct SVG is rendered once per size and device pixel ratio, later requests get the same QPixmap,
+    so drawing an icon is a blit instead of parsing and rendering the SVG again.
+    The least recently used pixmaps are dropped when their total memory exceeds the budget.
+    Renderers of the recently rendered SVGs are kept as well, so rendering another size doesn't parse the SVG again.
+    """
+    def __init__(self, budget: int = 32 * 1024 * 1024, renderer_count: int = 64):
+        """
+        :param budget: max memory of all the pixmaps, bytes
+        :param renderer_count: max number of renderers kept for rendering other sizes
+        """
+        self.budget = budget
+        self.pixmaps = OrderedDict()    # (SVG, 宽, 高, 设备像素比) -> QPixmap，按最近使用排序
+        self.cost = 0                   # 所有像素图占用的内存，字节
+        self.renderer_count = renderer_count
+        self.renderers = OrderedDict()  # SVG -> QSvgRenderer，按最近使用排序，引用使其留在共享的渲染器池中
+
+    def setBudget(self, budget: int):
+        """
+        Set the max memory of all the pixmaps
+        :param budget: bytes
+        """
+        self.budget = budget
+        self._evict()
+
+    def pixmap(self, svg, width: int, height: int, device_pixel_ratio: float = 1.0):
+        """
+        Get the SVG rendered in the size
+        :param svg: SVG data as bytes, or path of an SVG file
+        :param width: logical width
+        :param height: logical height
+        :param device_pixel_ratio: device pixel ratio of the screen to draw on
+        :return: QPixmap with the device pixel ratio set, don't paint on it
+        """
+        key = (svg, width, height, device_pixel_ratio)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+            return pixmap
+
+        pixmap = self._render(svg, width, height, device_pixel_ratio)
+        self.pixmaps[key] = pixmap
+        self.cost += self._cost(pixmap)
+        self._evict()
+        return pixmap
+
+    def renderer(self, svg):
+        """
+        Get the renderer of the SVG, which is kept while it is among the recently rendered ones
+        :param svg: SVG data as bytes, or path of an SVG file
+        :return: QSvgRenderer shared with the renderer pool
+        """
+        renderer = self.renderers.get(svg)
+        if renderer is not None:
+            self.renderers.move_to_end(svg)
+            return renderer
+
+        renderer = get_svg_renderer_pool().renderer(svg)
+        self.renderers[svg] = renderer
+        if len(self.renderers) > self.renderer_count:
+            self.renderers.popitem(last=False)
+        return renderer
+
+    def _render(self, svg, width, height, device_pixel_ratio):
+        renderer = self.renderer(svg)  # 同一个 SVG 的不同尺寸只解析一次
+
+        pixmap = QPixmap(max(1, round(width * device_pixel_ratio)), max(1, round(height * device_pixel_ratio)))
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        renderer.render(painter, QRectF(0, 0, pixmap.width(), pixmap.height()))
+        painter.end()
+
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
+
+    @staticmethod
+    def _cost(pixmap):
+        return pixmap.width() * pixmap.height() * 4
+
+    def _evict(self):
+        # 保留最近放入的像素图，即使它本身超出预算
+        while self.cost > self.budget and len(self.pixmaps) > 1:
+            _, pixmap = self.pixmaps.popitem(last=False)
+            self.cost -= self._cost(pixmap)
+
+    def clear(self):
+        self.pixmaps.clear()
+        self.renderers.clear()
+        self.cost = 0
+
+
+_raster_cache = None
+
+
+def get_icon_raster_cache():
+    """
+    Get the process-wide SiIconRasterCache, create it if it doesn't exist
+    :return: SiIconRasterCache
+    """
+    global _raster_cache
+    if _raster_cache is None:
+        _raster_cache = SiIconRasterCache()
+    return _raster_cache
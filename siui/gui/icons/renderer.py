@@ -0,0 +1,56 @@
+import weakref
+
+from PyQt5.QtCore import QByteArray
+from PyQt5.QtSvg import QSvgRenderer
+
+
+class SiSvgRendererPool:
+    """
+    Shared QSvgRenderer for each distinct SVG, so identical SVG sources are parsed only once.\n
+    Renderers are held weakly, a renderer is deleted when nothing uses it any more.
+    Renderers handed out are shared, don't load anything else into them.
+    """
+    def __init__(self):
+        self.renderers = weakref.WeakValueDictionary()  # SVG 数据或文件路径 -> QSvgRenderer
+
+    @staticmethod
+    def key(svg):
+        """
+        Get the key of an SVG in the pool
+        :param svg: SVG data as bytes, or path of an SVG file
+        :return: the data as bytes, or the path
+        """
+        # bytes 对象会缓存自身的哈希值，着色后的图标又总是同一个对象，所以查找时不需要重新计算摘要
+        if isinstance(svg, (str, bytes)):
+            return svg
+        return bytes(svg)
+
+    def renderer(self, svg):
+        """
+        Get the shared renderer of the SVG, parse it if no one is using it
+        :param svg: SVG data as bytes, or path of an SVG file
+        :return: QSvgRenderer, keep a reference to it while using it
+        """
+        key = self.key(svg)
+        renderer = self.renderers.get(key)
+        if renderer is None:
+            renderer = QSvgRenderer(key if isinstance(key, str) else QByteArray(key))
+            self.renderers[key] = renderer
+        return renderer
+
+    def __len__(self):
+        return len(self.renderers)
+
+
+_renderer_pool = None
+
+
+def get_svg_renderer_pool():
+    """
+    Get the process-wide SiSvgRendererPool, create it if it doesn't exist
+    :return: SiSvgRendererPool
+    """
+    global _renderer_pool
+    if _renderer_pool is None:
+        _renderer_pool = SiSvgRendererPool()
+    return _renderer_pool
@@ -1,6 +1,22 @@
 from siui.components import SiWidget, SiLabel, SiSvgLabel, SiDenseVContainer
 from siui.core.color import SiColor
 from siui.core.globals import SiGlobal
+from siui.core.globals.stylesheet import style_template
+
+_body_content_qss = style_template(
+    "#body_content_label {"
+    "     border-radius: 8px;"
+    "    background-color: {INTERFACE_BG_B};"
+    "    border: 1px solid {INTERFACE_BG_C};"
+    "}"
+)
+_body_button_qss = style_template(
+    "#body_button_label {"
+    "     border-radius: 8px;"
+    "    background-color: {INTERFACE_BG_C};"
+    "    border: 1px solid {INTERFACE_BG_C};"
+    "}"
+)
 
 
 class SiModalDialog(SiWidget):
@@ -48,21 +64,8 @@ class SiModalDialog(SiWidget):
     def reloadStyleSheet(self):
         super().reloadStyleSheet()
         self.theme_label.setColor(self.colorGroup().fromToken(SiColor.THEME))
-        self.body_content_label.setStyleSheet(
-            "#body_content_label {"
-            "     border-radius: 8px;"
-            f"    background-color: {self.colorGroup().fromToken(SiColor.INTERFACE_BG_B)};"
-            f"    border: 1px solid {self.colorGroup().fromToken(SiColor.INTERFACE_BG_C)};"
-            "}"
-        )
-        self.body_button_label.setStyleSheet(
-            "#body_button_label {"
-            "     border-radius: 8px;"
-            f"    background-color: {self.colorGroup().fromToken(SiColor.INTERFACE_BG_C)};"
-            f"    border: 1px solid {self.colorGroup().fromToken(SiColor.INTERFACE_BG_C)};"
-            "}"
-
-        )
+        self.body_content_label.setStyleSheet(_body_content_qss.render(self.colorGroup()))
+        self.body_button_label.setStyleSheet(_body_button_qss.render(self.colorGroup()))
 
     def adjustSize(self):
         self.content_container.setFixedWidth(self.width() - 2 * self.body_padding_h)
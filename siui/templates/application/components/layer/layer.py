@@ -25,6 +25,7 @@ class SiLayer(SiWidget):
         self.close_on_dim_clicked = True
 
         self.dim_ = SiLabelHasClickedSignal(self)
+        self.dim_.setColorPainted(True)
         self.dim_.setColor(SiColor.trans(self.colorGroup().fromToken(SiColor.LAYER_DIM), 0.0))
         self.dim_.clicked.connect(self.on_dim_layer_clicked)
 
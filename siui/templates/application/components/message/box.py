@@ -33,6 +33,7 @@ class SiSideMessageContent(SiWidget):
         self.theme_icon = SiSvgLabel(self)
         self.theme_icon.resize(32, 32)
         self.theme_icon.setSvgSize(20, 20)
+        self.theme_icon.setRasterized(True)  # 每条消息的图标都相同，共享栅格化的结果
         self.theme_icon.load(SiGlobal.siui.iconpack.get("ic_fluent_info_regular"))
 
         self.container_ = SiDenseVContainer(self)
@@ -41,12 +42,14 @@ class SiSideMessageContent(SiWidget):
 
         self.close_button = SiSimpleButton(self)
         self.close_button.setBorderRadius(6)
+        self.close_button.attachment().icon().setRasterized(True)
         self.close_button.attachment().load(SiGlobal.siui.iconpack.get("ic_fluent_checkmark_regular"))
         self.close_button.clicked.connect(self.parent().closeLater)
 
         self.flash_layer = SiLabel(self)
         self.flash_layer.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.flash_layer.setFixedStyleSheet("border-radius: 6px")
+        self.flash_layer.setColorPainted(True)
         self.flash_layer.setColor(SiColor.trans(self.colorGroup().fromToken(SiColor.SIDE_MSG_FLASH), 0))
         self.flash_layer.animationGroup().fromToken("color").setFactor(1/8)
         self.flash_layer.animationGroup().fromToken("color").setBias(0.001)
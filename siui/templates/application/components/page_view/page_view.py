@@ -15,6 +15,7 @@ class PageButton(SiToggleButton):
 
         # Set your own style
         self.setBorderRadius(6)
+        self.attachment().icon().setRasterized(True)  # 从共享的栅格化缓存绘制图标
         self.colorGroup().assign(SiColor.BUTTON_OFF, "#00FFFFFF")
         self.colorGroup().assign(SiColor.BUTTON_ON, "#10FFFFFF")
 
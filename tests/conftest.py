@@ -0,0 +1,34 @@
+import os
+import tempfile
+
+# 无需显示器，缓存文件写入临时目录，必须在导入 PyQt5 和 siui 之前设置
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["XDG_CACHE_HOME"] = tempfile.mkdtemp(prefix="siui-tests-")
+os.environ.pop("SIUI_THEME_CACHE", None)
+
+import pytest  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+_app = QApplication.instance() or QApplication([])
+
+from siui.core.animation import SiManualClockBackend, get_clock_backend, set_clock_backend  # noqa: E402
+
+
+@pytest.fixture
+def qapp():
+    return _app
+
+
+@pytest.fixture
+def clock(qapp):
+    """
+    Drive all the animations by a manual clock during the test, animations left running are dropped afterwards
+    """
+    backend = SiManualClockBackend()
+    previous = get_clock_backend()
+    set_clock_backend(backend)
+    yield backend
+
+    for frame_clock in list(backend.next_ticks):
+        frame_clock.animations.clear()
+    set_clock_backend(previous)
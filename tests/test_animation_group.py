@@ -0,0 +1,94 @@
+import pytest
+
+from siui.core.animation import SiAnimationGroup, SiExpAnimation
+
+
+def _animation(target=100):
+    ani = SiExpAnimation()
+    ani.setCurrent(0)
+    ani.setTarget(target)
+    return ani
+
+
+def _group(*targets):
+    group = SiAnimationGroup()
+    animations = [_animation(target) for target in targets]
+    for index, ani in enumerate(animations):
+        group.addMember(ani, f"ani_{index}")
+    return group, animations
+
+
+def test_lookup_by_token():
+    group, (first, second) = _group(1, 2)
+
+    assert group.fromToken("ani_1") is second
+    assert "ani_0" in group
+    assert list(group) == [first, second]
+    with pytest.raises(ValueError, match="already exists"):
+        group.addMember(_animation(), "ani_0")
+    with pytest.raises(ValueError, match="not found"):
+        group.fromToken("missing")
+
+
+def test_lazy_members_are_created_on_first_access():
+    group, _ = _group(1)
+    created = []
+    group.addLazyMember(lambda: created.append(None) or _animation(), "lazy")
+
+    assert group.hasMember("lazy")
+    assert group.isCreated("lazy") is False
+    assert group.fromToken("lazy") is group.fromToken("lazy")
+    assert len(created) == 1
+
+
+def test_list_attributes_are_kept():
+    group, (first, second) = _group(1, 2)
+    group.addLazyMember(_animation, "lazy")
+    group.addMember(_animation(), "last")
+
+    assert group.tokens == ["ani_0", "ani_1", "lazy", "last"]
+    assert group.animations[:2] == [first, second]
+    assert group.animations[2] is group.fromToken("lazy")
+    assert dict(zip(group.tokens, group.animations))["ani_1"] is second
+
+
+def test_remove_member():
+    group, (first, _) = _group(1, 2)
+    group.addLazyMember(_animation, "lazy")
+    first.start()
+
+    assert group.removeMember("ani_0") is first
+    assert first.isActive() is False
+    assert group.removeMember("lazy") is None
+    assert group.tokens == ["ani_1"]
+
+
+def test_bulk_operations(clock):
+    group, animations = _group(10, 20, 30)
+    for ani in animations:
+        ani.start()
+
+    group.pauseAll()
+    assert not any(ani.isActive() for ani in animations)
+    group.resumeAll()
+    assert all(ani.isActive() for ani in animations)
+
+    group.stopAll()
+    assert not any(ani.isActive() for ani in animations)
+
+
+def test_finish_all_finishes_paused_animations(clock):
+    group, (running, paused, idle) = _group(10, 20, 30)
+    finished = []
+    for ani in (running, paused, idle):
+        ani.finished.connect(finished.append)
+    running.start()
+    paused.start()
+    group.pauseAll()
+    running.start()
+
+    group.finishAll()
+    assert [float(value) for value in finished] == [10, 20]
+    assert float(paused.current()) == 20
+    assert float(idle.current()) == 0
+    assert group.paused == []
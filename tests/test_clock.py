@@ -0,0 +1,81 @@
+import pytest
+
+from siui.core.animation import SiExpAnimation, get_clock
+
+
+def _animation(current=0, target=100):
+    ani = SiExpAnimation()
+    ani.setFactor(1/4)
+    ani.setBias(1)
+    ani.setCurrent(current)
+    ani.setTarget(target)
+    return ani
+
+
+def test_animations_share_one_clock(clock):
+    first, second = _animation(), _animation()
+    assert first.clock() is second.clock() is get_clock(first.interval())
+
+    first.start()
+    second.start()
+    assert clock.isTicking(first.clock())
+    assert len(clock.next_ticks) == 1
+
+
+def test_clock_sleeps_when_nothing_is_animating(clock):
+    ani = _animation()
+    ani.start()
+    clock.run_until_idle()
+
+    assert ani.isActive() is False
+    assert clock.isTicking(ani.clock()) is False
+    assert clock.isIdle()
+
+
+def test_start_stop_and_signals(clock):
+    ani = _animation()
+    ticks, finished = [], []
+    ani.ticked.connect(ticks.append)
+    ani.finished.connect(finished.append)
+
+    assert ani.try_to_start() is False  # 已经开始，返回 False 表示本次尝试没有开始新的动画
+    clock.advance(ani.interval())
+    assert len(ticks) == 1
+    ani.stop()
+    clock.advance(ani.interval() * 10)
+    assert len(ticks) == 1
+
+    ani.start()
+    clock.run_until_idle()
+    assert float(ani.current()) == 100
+    assert [float(value) for value in finished] == [100]
+
+
+def test_delayed_start(clock):
+    ani = _animation()
+    ani.start(delay=200)
+
+    clock.advance(199)
+    assert ani.isActive() is False
+    clock.advance(1)
+    assert ani.isActive()
+
+
+def test_run_until_idle_is_deterministic(clock):
+    def run():
+        ani = _animation(0, 500)
+        values = []
+        ani.ticked.connect(lambda value: values.append(float(value)))
+        ani.start()
+        return clock.run_until_idle(), values
+
+    assert run() == run()
+
+
+def test_run_until_idle_raises_on_endless_animation(clock):
+    ani = _animation()
+    ani.finished.connect(lambda _: ani.start())  # 完成后立即重新开始，永远不会停止
+    ani.start()
+
+    with pytest.raises(RuntimeError):
+        clock.run_until_idle(timeout=1000)
@@ -0,0 +1,63 @@
+import numpy
+import pytest
+
+from siui.core.color import SiColor
+
+codes = ["#FF3366", "#80102030", "#00000000", "#FFFFFF", "#7F7F7F7F", "#0A0B0C"]
+
+
+def _reference_mix(fore, post, weight):
+    # 缓存前的算法
+    fore = numpy.array(SiColor.toArray(fore), dtype=numpy.int16)
+    post = numpy.array(SiColor.toArray(post), dtype=numpy.int16)
+    return SiColor.toCode(fore * weight + post * (1 - weight))
+
+
+def test_parse_and_format():
+    assert SiColor.toArray("#FF3366").tolist() == [255, 255, 51, 102]
+    assert SiColor.toTuple("#80102030") == (128, 16, 32, 48)
+    assert SiColor.toInt("#80102030") == 0x80102030
+    assert SiColor.fromInt(0xFFFF3366) == "#FF3366"
+    assert SiColor.fromInt(0xFFFF3366, force_rgba=True) == "#FFFF3366"
+    assert SiColor.toCode([128, 16, 32, 48]) == "#80102030"
+
+    with pytest.raises(ValueError, match="Unexpected color code"):
+        SiColor.toTuple("#12345")
+
+
+@pytest.mark.parametrize("weight", [0, 0.25, 0.5, 0.9, 1])
+def test_mix_matches_array_arithmetic(weight):
+    for fore in codes:
+        for post in codes:
+            assert SiColor.mix(fore, post, weight) == _reference_mix(fore, post, weight)
+
+
+def test_trans():
+    assert SiColor.trans("#FF3366", 0.5) == "#7FFF3366"
+    assert SiColor.trans("#80102030", 1) == "#80102030"
+
+
+def test_bulk_operations_match_single_ones():
+    fore, post = codes, codes[::-1]
+    weights = numpy.linspace(0, 1, len(codes))
+
+    assert SiColor.mixMany(fore, post, weights) == [SiColor.mix(f, p, w) for f, p, w in zip(fore, post, weights)]
+    assert SiColor.mixMany(fore, "#000000", 0.3) == [SiColor.mix(f, "#000000", 0.3) for f in fore]
+    assert SiColor.transMany(codes, 0.5) == [SiColor.trans(code, 0.5) for code in codes]
+    assert SiColor.toCodeMany(SiColor.toArrayMany(codes)) == [SiColor.toCode(SiColor.toArray(c)) for c in codes]
+
+
+def test_gradient_and_lighten():
+    gradient = SiColor.gradient("#000000", "#FFFFFF", 5)
+    assert gradient[0] == "#000000"
+    assert gradient[-1] == "#FFFFFF"
+    assert len(gradient) == 5
+
+    assert SiColor.lightenMany(["#80000000"], 1) == ["#80FFFFFF"]
+    assert SiColor.lightenMany(["#FFFFFF"], -1) == ["#000000"]
+
+
+def test_contrast():
+    assert SiColor.contrast("#000000", "#FFFFFF") == pytest.approx(21)
+    assert SiColor.contrast("#FF3366", "#FF3366") == pytest.approx(1)
+    assert SiColor.contrast(["#000000", "#FFFFFF"], "#FFFFFF").tolist() == pytest.approx([21, 1])
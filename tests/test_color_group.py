@@ -0,0 +1,66 @@
+import pytest
+
+from siui.core.color import SiColor
+from siui.gui.color_group import SiColorGroup
+
+
+@pytest.fixture
+def chain():
+    root = SiColorGroup()
+    root.assign(SiColor.THEME, "#111111")
+    root.assign(SiColor.TEXT_A, "#222222")
+    middle = SiColorGroup(reference=root)
+    leaf = SiColorGroup(reference=middle)
+    return root, middle, leaf
+
+
+def test_lookups_are_cached(chain):
+    root, _, leaf = chain
+    assert leaf.fromToken(SiColor.THEME) == "#111111"
+    assert leaf.resolved == {SiColor.THEME: "#111111"}
+
+
+def test_changes_of_ancestors_reach_dependents(chain):
+    root, middle, leaf = chain
+    leaf.fromToken(SiColor.THEME)
+
+    root.assign(SiColor.THEME, "#333333")
+    assert leaf.fromToken(SiColor.THEME) == "#333333"
+
+    middle.assign(SiColor.THEME, "#444444")
+    assert leaf.fromToken(SiColor.THEME) == "#444444"
+
+    middle.setValid(False)
+    assert leaf.fromToken(SiColor.THEME) == "#333333"
+
+    middle.setValid(True)
+    middle.remove(SiColor.THEME)
+    assert leaf.fromToken(SiColor.THEME) == "#333333"
+
+    other = SiColorGroup()
+    other.assign(SiColor.THEME, "#555555")
+    middle.setReference(other)
+    assert leaf.fromToken(SiColor.THEME) == "#555555"
+
+    root_copy = SiColorGroup()
+    root_copy.assign(SiColor.THEME, "#666666")
+    other.overwrite(root_copy)
+    assert leaf.fromToken(SiColor.THEME) == "#666666"
+
+
+def test_changes_do_not_invalidate_unrelated_groups(chain):
+    root, middle, leaf = chain
+    sibling = SiColorGroup(reference=root)
+    sibling.fromToken(SiColor.THEME)
+    leaf.fromToken(SiColor.THEME)
+    generation = sibling.chainGeneration()
+
+    leaf.assign(SiColor.TEXT_B, "#777777")
+    SiColorGroup(overwrite=leaf)
+    unrelated = SiColorGroup()
+    unrelated.assign(SiColor.THEME, "#888888")
+
+    assert sibling.chainGeneration() == generation
+    assert sibling.resolved == {SiColor.THEME: "#111111"}
+    assert leaf.chainGeneration() > generation
+
@@ -0,0 +1,51 @@
+import numpy
+import pytest
+
+from siui.core.animation import Curve, SiCounterAnimation, SiCurve
+
+
+def test_curve_can_be_imported_from_abstract():
+    from siui.core.animation.abstract import Curve as AbstractCurve
+
+    assert AbstractCurve is Curve
+
+
+@pytest.mark.parametrize(("curve", "function"), [
+    (Curve.LINEAR, lambda x: x),
+    (Curve.EASE_IN_CUBIC, lambda x: x ** 3),
+    (Curve.EASE_OUT_QUINT, lambda x: 1 - (1 - x) ** 5),
+])
+def test_sampled_curves_match_functions(curve, function):
+    xs = numpy.linspace(0, 1, 97)
+    assert [curve(x) for x in xs] == pytest.approx(function(xs).tolist(), abs=1e-5)
+    assert curve.evaluateMany(xs).tolist() == pytest.approx([curve(x) for x in xs])
+
+
+def test_curves_end_at_one():
+    for curve in (Curve.EASE_IN_OUT_CUBIC, Curve.EASE_OUT_BACK, Curve.EASE_OUT_ELASTIC, Curve.spring()):
+        assert curve(0) == pytest.approx(0, abs=1e-9)
+        assert curve(1) == pytest.approx(1, abs=1e-9)
+
+    assert Curve.EASE_OUT_BACK.evaluateMany(numpy.linspace(0, 1, 101)).max() > 1  # 回弹曲线会越过终点
+
+
+def test_bezier_matches_css_ease():
+    ease = Curve.bezier(0.25, 0.1, 0.25, 1)
+    assert ease is Curve.bezier(0.25, 0.1, 0.25, 1)
+    assert ease(0.5) == pytest.approx(0.8024, abs=1e-3)
+    with pytest.raises(ValueError, match="control points"):
+        Curve.bezier(1.5, 0, 0, 1)
+
+
+def test_counter_animation_follows_curve(clock):
+    ani = SiCounterAnimation()
+    ani.setDuration(160)
+    ani.setCurve(Curve.EASE_IN_CUBIC)
+    values = []
+    ani.ticked.connect(lambda value: values.append(float(value)))
+    ani.start()
+    clock.run_until_idle()
+
+    assert values == sorted(values)
+    assert values[-1] == 1
+    assert isinstance(Curve.LINEAR, SiCurve)
@@ -0,0 +1,92 @@
+import numpy
+import pytest
+
+from siui.core.animation import SiExpAnimation, animation
+
+
+def _animation(current, target, time_based=False):
+    ani = SiExpAnimation()
+    ani.setFactor(1/4)
+    ani.setBias(1)
+    ani.setTimeBased(time_based)
+    ani.setCurrent(current)
+    ani.setTarget(target)
+    return ani
+
+
+def _trajectories(clock, animations):
+    values = [[] for _ in animations]
+    for ani, trajectory in zip(animations, values):
+        ani.ticked.connect(lambda value, trajectory=trajectory: trajectory.append(numpy.asarray(value).tolist()))
+        ani.start()
+    clock.run_until_idle()
+    return values
+
+
+@pytest.mark.parametrize("time_based", [False, True])
+def test_batched_steps_match_single_steps(clock, monkeypatch, time_based):
+    def make():
+        return [_animation(i, [300 - i, i * 3], time_based) if i % 2 else _animation(i, 200 - i, time_based)
+                for i in range(80)]
+
+    monkeypatch.setattr(animation, "batch_threshold", 10 ** 9)
+    single = _trajectories(clock, make())
+    monkeypatch.setattr(animation, "batch_threshold", 1)
+    batched = _trajectories(clock, make())
+
+    assert batched == single
+
+
+def test_time_based_matches_frames_at_reference_rate(clock):
+    frame_based = _trajectories(clock, [_animation(0, 400)])[0]
+    time_based = _trajectories(clock, [_animation(0, 400, time_based=True)])[0]
+
+    assert time_based == pytest.approx(frame_based)
+
+
+def test_time_based_converges_in_the_same_time_with_dropped_frames(clock):
+    durations = []
+    for interval in (16, 48):
+        ani = _animation(0, 400, time_based=True)
+        ani.setInterval(interval)
+        ani.start()
+        durations.append(clock.run_until_idle())
+
+    # 按帧推进时，间隔变为三倍会使时长也变为三倍
+    assert durations[1] == pytest.approx(durations[0], abs=48)
+
+
+class NumpyExpAnimation(SiExpAnimation):
+    # 重写步进方法后不能使用快速路径，用于对照
+    def _step_length(self):
+        return super()._step_length()
+
+
+@pytest.mark.parametrize(("current", "target"), [(0, 100), (0.5, -0.25), ([0, 0], [400, -300]), ([1, 2, 3, 4], 0)])
+def test_fast_path_matches_numpy(clock, current, target):
+    fast, slow = SiExpAnimation(), NumpyExpAnimation()
+    for ani in (fast, slow):
+        ani.setFactor(1/4)
+        ani.setBias(0.01)
+        ani.setCurrent(current)
+        ani.setTarget(target)
+
+    assert _trajectories(clock, [fast]) == _trajectories(clock, [slow])
+
+
+def test_fast_path_gives_numpy_arrays(clock):
+    ani = _animation([0, 0], [30, 40])
+    ticks, finished = [], []
+    ani.ticked.connect(ticks.append)
+    ani.finished.connect(finished.append)
+    ani.start()
+    clock.run_until_idle()
+
+    assert all(isinstance(value, numpy.ndarray) for value in ticks + finished)
+    assert isinstance(ani.current(), numpy.ndarray)
+    assert (ani.current() + ani.current()).tolist() == [60, 80]  # 数组运算，而不是拼接元组
+
+    target = ani.target()
+    target[1] += 10
+    ani.setTarget(target)
+    assert ani.target().tolist() == [30, 50]
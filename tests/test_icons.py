@@ -0,0 +1,194 @@
+import gc
+import os
+
+import pytest
+from PyQt5.QtGui import QColor
+
+from siui.gui.color_group import SiThemeCache, theme_cache
+from siui.gui.icons import renderer as renderer_module
+from siui.gui.icons.compiled import SiCompiledIconFile, compile_icon_file, compiled_cache_path
+from siui.gui.icons.parser import SiGlobalIconPack, SiIconDict, SiIconFile
+from siui.gui.icons.raster import SiIconRasterCache
+
+square = ('<svg width="16" height="16" viewBox="0 0 16 16" xmlns="http://www.w3.org/2000/svg">'
+          '<rect width="16" height="16" fill="<<<COLOR_CODE>>>"/></svg>')
+circle = ('<svg width="16" height="16" viewBox="0 0 16 16" xmlns="http://www.w3.org/2000/svg">'
+          '<circle cx="8" cy="8" r="8" fill="<<<COLOR_CODE>>>"/></svg>')
+
+
+@pytest.fixture
+def icons_path(tmp_path):
+    path = tmp_path / "test.icons"
+    path.write_text(f"## comment\n\nsquare////{square}\ncircle////{circle}  \n", encoding="utf-8")
+    return str(path)
+
+
+def test_icon_file_is_indexed_lazily(icons_path):
+    icon_file = SiIconFile(icons_path)
+    assert icon_file.index_ is None
+
+    assert "square" in icon_file
+    assert list(icon_file.names()) == ["square", "circle"]
+    assert icon_file.read("circle") == circle
+    with pytest.raises(KeyError):
+        icon_file.read("missing")
+
+
+def test_icon_dict_layers(icons_path):
+    icons = SiIconDict()
+    icons.addFile(SiIconFile(icons_path))
+    icons["square"] = "<svg/>"
+    icons["extra"] = "<svg/>"
+
+    assert icons["square"] == "<svg/>"  # 后加入的层覆盖之前的层
+    assert icons["circle"] == circle
+    assert list(icons) == ["square", "circle", "extra"]
+    assert len(icons) == 3
+    assert dict(icons)["circle"] == circle
+
+
+def test_built_in_packages_are_complete():
+    pack = SiGlobalIconPack()
+    pack.set_default_color("#123456")
+
+    names = list(pack.get_dict())
+    assert len(names) > 1000
+    assert "ic_fluent_home_regular" in pack.get_dict("fluent_ui_icon_regular.icons")
+    assert b"#123456" in pack.get("ic_fluent_home_regular")
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_compiled_icon_file(icons_path, tmp_path, compress):
+    path = str(tmp_path / "test.siicons")
+    assert compile_icon_file(icons_path, path, compress) == 2
+    assert sorted(os.listdir(tmp_path)) == ["test.icons", "test.siicons"]  # 没有留下临时文件
+
+    icon_file = SiCompiledIconFile(path)
+    assert icon_file.names() == ["square", "circle"]
+    assert "circle" in icon_file
+    assert "missing" not in icon_file
+    assert icon_file.read("square") == square
+    assert icon_file.read("circle") == circle
+    with pytest.raises(KeyError):
+        icon_file.read("missing")
+
+
+def test_compiled_icon_file_falls_back_to_source(icons_path, tmp_path):
+    path = tmp_path / "broken.siicons"
+    path.write_bytes(b"not a compiled file")
+
+    icon_file = SiCompiledIconFile(str(path), source=icons_path)
+    assert icon_file.read("circle") == circle
+    assert isinstance(icon_file.fallback, SiIconFile)
+
+
+def test_older_compiled_copies_are_pruned(icons_path, cache_dir):
+    icons_dir = cache_dir / "siui" / "icons"
+    icons_dir.mkdir(parents=True)
+    (icons_dir / "test-1-2.siicons").write_bytes(b"")
+    (icons_dir / "test-extra-1-2.siicons").write_bytes(b"")  # 另一个图标包的文件
+
+    icon_file = SiCompiledIconFile(source=icons_path)
+    assert icon_file.read("square") == square
+    assert sorted(os.listdir(icons_dir)) == sorted([os.path.basename(compiled_cache_path(icons_path)),
+                                                    "test-extra-1-2.siicons"])
+
+
+def test_icon_packages_are_compiled_only_with_the_theme_cache(icons_path, cache_dir, monkeypatch):
+    pack = SiGlobalIconPack()
+    pack.load_from_file(icons_path)
+    assert pack.get("square", "#123456") == square.replace("<<<COLOR_CODE>>>", "#123456").encode()
+    assert cache_dir.exists() is False
+
+    monkeypatch.setattr(theme_cache, "_theme_cache", SiThemeCache(str(cache_dir / "theme_cache.bin")))
+    pack = SiGlobalIconPack()
+    pack.load_from_file(icons_path)
+    assert pack.get("square", "#123456") == square.replace("<<<COLOR_CODE>>>", "#123456").encode()
+    assert os.path.isfile(compiled_cache_path(icons_path))
+
+
+def test_loaded_files_override_colorized_icons(icons_path):
+    pack = SiGlobalIconPack()
+    pack.append("square", circle)
+    assert pack.get("square", "#123456") == circle.replace("<<<COLOR_CODE>>>", "#123456").encode()
+
+    pack.load_from_file(icons_path)
+    assert pack.get("square", "#123456") == square.replace("<<<COLOR_CODE>>>", "#123456").encode()
+
+
+def test_raster_cache_reuses_pixmaps(qapp):
+    cache = SiIconRasterCache()
+    svg = square.replace("<<<COLOR_CODE>>>", "#FF0000").encode()
+
+    pixmap = cache.pixmap(svg, 16, 16)
+    assert cache.pixmap(svg, 16, 16) is pixmap
+    assert cache.pixmap(svg, 32, 32) is not pixmap
+    assert pixmap.toImage().pixelColor(8, 8) == QColor("#FF0000")
+
+    hidpi = cache.pixmap(svg, 16, 16, 2.0)
+    assert (hidpi.width(), hidpi.devicePixelRatio()) == (32, 2.0)
+
+
+def test_raster_cache_keeps_within_budget(qapp):
+    cache = SiIconRasterCache(budget=3 * 16 * 16 * 4)
+    svg = square.replace("<<<COLOR_CODE>>>", "#FF0000").encode()
+    first = cache.pixmap(svg, 16, 16)
+    for size in (17, 18, 19, 20):
+        cache.pixmap(svg, size, 16)
+
+    assert cache.cost <= cache.budget
+    assert cache.pixmap(svg, 16, 16) is not first  # 最久未使用的像素图被移除
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    """
+    Use a new renderer pool and record each SVG parsed by it
+    """
+    parsed = []
+
+    class CountingRenderer(renderer_module.QSvgRenderer):
+        def __init__(self, *args):
+            super().__init__(*args)
+            parsed.append(args)
+
+    monkeypatch.setattr(renderer_module, "QSvgRenderer", CountingRenderer)
+    monkeypatch.setattr(renderer_module, "_renderer_pool", renderer_module.SiSvgRendererPool())
+    return parsed
+
+
+def test_raster_cache_parses_each_svg_once(qapp, parsed):
+    cache = SiIconRasterCache()
+    svg = square.replace("<<<COLOR_CODE>>>", "#FF0000").encode()
+
+    cache.pixmap(svg, 16, 16)
+    renderer = cache.renderer(svg)
+    gc.collect()
+    for size in (24, 32, 48):
+        cache.pixmap(svg, size, size)
+    cache.pixmap(svg, 16, 16, 2.0)
+
+    assert len(parsed) == 1
+    assert cache.renderer(svg) is renderer
+    assert renderer_module.get_svg_renderer_pool().renderer(bytes(bytearray(svg))) is renderer  # 内容相同即可共享
+
+
+def test_raster_cache_keeps_recent_renderers(qapp, parsed):
+    cache = SiIconRasterCache(renderer_count=1)
+    red = square.replace("<<<COLOR_CODE>>>", "#FF0000").encode()
+    blue = square.replace("<<<COLOR_CODE>>>", "#0000FF").encode()
+
+    cache.pixmap(red, 16, 16)
+    cache.pixmap(blue, 16, 16)
+    gc.collect()
+    assert list(cache.renderers) == [blue]
+
+    cache.pixmap(blue, 32, 32)
+    cache.pixmap(red, 32, 32)
+    assert len(parsed) == 3  # 红色的渲染器已经被移除，需要重新解析
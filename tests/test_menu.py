@@ -0,0 +1,22 @@
+from PyQt5.QtWidgets import QWidget
+
+from siui.components.menu.menu import SiMenu
+from siui.core.color import SiColor
+from siui.core.globals import SiGlobal
+from siui.gui.color_group import SiColorGroup
+
+
+def test_option_text_follows_its_own_color_group(qapp):
+    menu = SiMenu()
+    menu.addOption("first")
+    menu.addOption("second")
+    first, second = menu.options()
+
+    first.color_group = SiColorGroup(reference=SiGlobal.siui.colors)
+    first.colorGroup().assign(SiColor.TEXT_B, "#ff123456")
+    first.reloadStyleSheet()
+    second.reloadStyleSheet()
+
+    assert "#ff123456" in QWidget.styleSheet(first.text_label)
+    assert "#ff123456" not in QWidget.styleSheet(second.text_label)
+    assert SiGlobal.siui.colors.fromToken(SiColor.TEXT_B) in QWidget.styleSheet(second.text_label)
@@ -0,0 +1,52 @@
+import pytest
+
+from siui.core.color import SiColor
+from siui.gui.color_group import BrightColorGroup, DarkColorGroup, SiColorGroup, SiPalette
+
+
+def test_palette_lookup():
+    palette = SiPalette.fromMapping({SiColor.THEME: "#855198", "TEXT_A": "#80FFFFFF"})
+
+    assert palette.code(SiColor.THEME) == "#855198"
+    assert palette.argb(SiColor.TEXT_A) == 0x80FFFFFF
+    assert palette.code(SiColor.TEXT_B) is None
+    assert palette.isAssigned(SiColor.TEXT_B) is False
+    assert set(palette.tokens()) == {SiColor.THEME, SiColor.TEXT_A}
+    assert len(palette) == 2
+
+
+def test_palette_is_frozen():
+    palette = SiPalette.fromMapping({SiColor.THEME: "#855198"})
+    with pytest.raises(AttributeError):
+        palette.codes = ()
+
+
+def test_overlay_and_diff():
+    lower = SiPalette.fromMapping({SiColor.THEME: "#111111", SiColor.TEXT_A: "#222222"})
+    upper = SiPalette.fromMapping({SiColor.TEXT_A: "#333333"})
+    merged = lower.overlay(upper)
+
+    assert merged.code(SiColor.THEME) == "#111111"
+    assert merged.code(SiColor.TEXT_A) == "#333333"
+    assert lower.diff(merged) == {"TEXT_A"}
+    assert lower.overlay({SiColor.THEME: None}).isAssigned(SiColor.THEME) is False
+
+
+def test_serialization_and_digest():
+    palette = DarkColorGroup().palette
+    restored = SiPalette.fromDict(palette.toDict())
+
+    assert restored == palette
+    assert restored.digest() == palette.digest()
+    assert palette.digest() != BrightColorGroup().palette.digest()
+
+
+def test_built_in_groups_resolve_through_palettes():
+    dark = DarkColorGroup()
+    group = SiColorGroup(reference=dark)
+
+    assert dark.palette is DarkColorGroup().palette  # 内置调色板只构建一次
+    assert group.fromToken(SiColor.THEME) == "#855198"
+    assert dark["THEME"] == "#855198"
+    assert group.isAssigned(SiColor.THEME)
+    assert dark.snapshot() is dark.palette
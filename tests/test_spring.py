@@ -0,0 +1,55 @@
+import numpy
+import pytest
+
+from siui.core.animation import SiSpringAnimation
+
+
+def _spring(damping, current=0, target=100):
+    ani = SiSpringAnimation()
+    ani.setDamping(damping)
+    ani.setCurrent(current)
+    ani.setTarget(target)
+    return ani
+
+
+@pytest.mark.parametrize("damping", [10, 26, 60])  # 欠阻尼、临界阻尼、过阻尼
+def test_spring_settles_at_target(clock, damping):
+    ani = _spring(damping)
+    ani.start()
+    elapsed = clock.run_until_idle()
+
+    assert float(ani.current()) == 100
+    assert (ani.velocity() == 0).all()
+    assert elapsed <= ani.settlingTime() * 4  # settlingTime 估计的是 2% 误差内的时间，这里的精度更高
+
+
+def test_underdamped_spring_overshoots(clock):
+    ani = _spring(10)
+    peak = []
+    ani.ticked.connect(lambda value: peak.append(float(value)))
+    ani.start()
+    clock.run_until_idle()
+
+    assert ani.dampingRatio() < 1
+    assert max(peak) > 100
+
+
+def test_spring_is_stable_at_any_interval(clock):
+    for interval in (8, 100, 500):
+        ani = _spring(26)
+        ani.setInterval(interval)
+        ani.start()
+        clock.run_until_idle()
+        assert float(ani.current()) == 100
+
+
+def test_velocity_is_kept_when_target_changes(clock):
+    ani = _spring(26, target=[100, 0])
+    ani.start()
+    clock.advance(100)
+    velocity = numpy.array(ani.velocity())
+
+    ani.setTarget([0, 0])
+    assert (ani.velocity() == velocity).all()
+    clock.run_until_idle()
+    assert ani.current().tolist() == [0, 0]
@@ -0,0 +1,81 @@
+from PyQt5.QtWidgets import QLabel, QWidget
+
+from siui.components.widgets.abstracts.widget import SiWidget
+from siui.components.widgets.label import SiLabel
+from siui.core.globals.registry import reload_tree
+from siui.core.globals.stylesheet import batch_style_sheets, pending_style_sheet
+
+padding = "color:#fff; padding-left:16px"
+
+
+def test_style_sheet_is_applied_at_once(qapp):
+    label = SiLabel()
+    label.setStyleSheet(padding)
+    assert QWidget.styleSheet(label) == padding
+
+    label.setText("hello world")
+    label.adjustSize()
+    reference = QLabel("hello world")
+    reference.setFont(label.font())
+    reference.setStyleSheet(padding)
+    reference.adjustSize()
+    assert label.width() == reference.width()
+
+
+def test_batch_applies_only_the_last_style_sheet(qapp):
+    widget = SiWidget()
+    applied = []
+    original = QWidget.styleSheet(widget)
+
+    with batch_style_sheets():
+        widget.setStyleSheet("color: #111111")
+        widget.setStyleSheet("color: #222222")
+        applied.append(QWidget.styleSheet(widget))
+        assert widget.styleSheet() == "color: #222222"
+        assert pending_style_sheet(widget) == "color: #222222"
+
+    assert applied == [original]
+    assert QWidget.styleSheet(widget) == "color: #222222"
+    assert pending_style_sheet(widget) is None
+
+
+def test_nested_batches_apply_when_the_outermost_ends(qapp):
+    widget = SiWidget()
+    with batch_style_sheets():
+        with batch_style_sheets():
+            widget.setStyleSheet("color: #111111")
+        assert pending_style_sheet(widget) == "color: #111111"
+    assert QWidget.styleSheet(widget) == "color: #111111"
+
+
+def test_size_is_measured_with_the_pending_style_sheet(qapp):
+    reference = SiLabel()
+    reference.setStyleSheet(padding)
+    reference.setText("hello world")
+
+    label = SiLabel()
+    label.setText("hello world")
+    with batch_style_sheets():
+        label.setStyleSheet(padding)
+        assert label.sizeHint() == reference.sizeHint()
+        label.adjustSize()
+        reference.adjustSize()
+        assert label.width() == reference.width()
+
+
+def test_reload_tree_is_batched(qapp):
+    class Restyled(SiWidget):
+        applied = []
+
+        def reloadStyleSheet(self):
+            self.setStyleSheet("color: #111111")
+            self.setStyleSheet("color: #222222")
+            self.applied.append(QWidget.styleSheet(self))
+
+    root = Restyled()
+    Restyled(parent=root)
+    root.show()
+
+    reload_tree(root)
+    assert Restyled.applied == ["", ""]
+    assert [QWidget.styleSheet(widget) for widget in (root, *root.findChildren(Restyled))] == ["color: #222222"] * 2
@@ -0,0 +1,77 @@
+import gc
+
+from siui.components.widgets.abstracts.widget import SiWidget
+from siui.core.color import SiColor
+from siui.core.globals import SiThemeTransaction
+from siui.core.globals.registry import _widgets, is_registered, read_tokens, reload_tracked, reload_tree
+from siui.gui.color_group import SiColorGroup
+
+
+class ReloadCounter(SiWidget):
+    def __init__(self, token=SiColor.TEXT_A, *args, **kwargs):
+        self.reloads = []
+        self.token = token
+        super().__init__(*args, **kwargs)
+
+    def reloadStyleSheet(self):
+        self.reloads.append(self.colorGroup().fromToken(self.token))
+
+
+def test_widgets_are_held_weakly(qapp):
+    widget = ReloadCounter()
+    assert is_registered(widget)
+
+    del widget
+    gc.collect()
+    assert not any(isinstance(widget, ReloadCounter) for widget in _widgets)
+
+
+def test_reload_tree_reloads_each_widget_once(qapp):
+    root = ReloadCounter()
+    child = ReloadCounter(parent=root)
+    grandchild = ReloadCounter(parent=child)
+    root.show()
+
+    assert reload_tree(root) == 3
+    assert [len(widget.reloads) for widget in (root, child, grandchild)] == [1, 1, 1]
+
+
+def test_hidden_subtrees_are_reloaded_when_shown(qapp):
+    root = ReloadCounter()
+    hidden = ReloadCounter(parent=root)
+    child = ReloadCounter(parent=hidden)
+    hidden.hide()
+    root.show()
+
+    reload_tree(root)
+    assert (len(hidden.reloads), len(child.reloads)) == (0, 0)
+
+    hidden.show()
+    assert (len(hidden.reloads), len(child.reloads)) == (1, 1)
+
+
+def test_tokens_read_in_reload_are_recorded(qapp):
+    widget = ReloadCounter(SiColor.THEME)
+    reload_tracked(widget)
+    assert read_tokens(widget) == {"THEME"}
+
+
+def test_transaction_restyles_only_affected_widgets(qapp):
+    colors = SiColorGroup()
+    colors.assign(SiColor.TEXT_A, "#111111")
+    colors.assign(SiColor.THEME, "#222222")
+
+    root = ReloadCounter(SiColor.TEXT_A)
+    root.colorGroup().setReference(colors)
+    other = ReloadCounter(SiColor.THEME, parent=root)
+    other.colorGroup().setReference(colors)
+    root.show()
+    reload_tree(root)
+
+    with SiThemeTransaction(colors, [root]) as transaction:
+        colors.assign(SiColor.TEXT_A, "#333333")
+
+    assert transaction.changedTokens() == {"TEXT_A"}
+    assert transaction.restyledCount() == 1
+    assert root.reloads == ["#111111", "#333333"]
+    assert other.reloads == ["#222222"]
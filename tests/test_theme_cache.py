@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from siui.core.globals import SiGlobal
+from siui.gui.color_group import BrightColorGroup, DarkColorGroup, SiThemeCache
+from siui.gui.color_group.theme_cache import source_digest
+
+
+@pytest.fixture
+def colors(monkeypatch, qapp):
+    monkeypatch.setattr(SiGlobal.siui, "colors", DarkColorGroup())
+    return SiGlobal.siui
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "theme_cache.bin")
+
+
+def test_round_trip(colors, cache_path):
+    cache = SiThemeCache(cache_path)
+    cache.store("color: {TEXT_A}", ("#ffffff",), "color: #ffffff")
+    assert cache.save() is True
+    assert cache.save() is False  # 没有新内容时不再写入
+
+    loaded = SiThemeCache(cache_path)
+    assert loaded.load() is True
+    assert loaded.lookup("color: {TEXT_A}", ("#ffffff",)) == "color: #ffffff"
+    assert os.listdir(os.path.dirname(cache_path)) == ["theme_cache.bin"]
+
+
+def test_entries_follow_the_global_palette(colors, cache_path):
+    cache = SiThemeCache(cache_path)
+    cache.store("color: {TEXT_A}", (), "dark")
+
+    colors.colors = BrightColorGroup()
+    assert cache.lookup("color: {TEXT_A}", ()) is None
+    colors.colors = DarkColorGroup()
+    assert cache.lookup("color: {TEXT_A}", ()) == "dark"
+
+
+def test_other_versions_are_ignored(colors, cache_path):
+    cache = SiThemeCache(cache_path)
+    cache.store("color: {TEXT_A}", (), "color: #ffffff")
+    cache.save()
+
+    loaded = SiThemeCache(cache_path)
+    loaded.version = "changed"
+    assert loaded.load() is False
+    assert loaded.lookup("color: {TEXT_A}", ()) is None
+
+
+def test_source_changes_change_the_version(tmp_path):
+    source = tmp_path / "module.py"
+    source.write_text("a = 1\n")
+    digest = source_digest(str(tmp_path))
+    assert source_digest(str(tmp_path)) == digest
+
+    source.write_text("a = 12\n")
+    assert source_digest(str(tmp_path)) != digest
+
+
+def test_unserializable_entries_are_not_saved(colors, cache_path):
+    cache = SiThemeCache(cache_path)
+    cache.store("color: {TEXT_A}", (), object())
+
+    assert cache.save() is False
+    assert os.listdir(os.path.dirname(cache_path)) == []
@@ -0,0 +1,73 @@
+from PyQt5.QtWidgets import QWidget
+
+from siui.components.widgets.abstracts.widget import SiWidget
+from siui.components.widgets.label import SiLabel
+from siui.core.animation import SiExpAnimation, SiVisibilityPolicy
+
+
+def test_animations_are_created_on_first_use(clock):
+    widget = SiWidget()
+    assert not any(widget.animationGroup().isCreated(token)
+                   for token in ("move", "resize", "opacity", "color", "showing"))
+
+    widget.moveTo(30, 40)
+    assert widget.animationGroup().isCreated("move")
+    assert not widget.animationGroup().isCreated("resize")
+
+
+def test_values_set_before_creation_are_kept(clock):
+    widget = SiWidget()
+    widget.setOpacity(0.3)
+    widget.resize(50, 60)
+
+    assert float(widget.animation_opacity.current()) == 0.3
+    assert list(widget.animation_resize.current()) == [50, 60]
+
+
+def test_move_finishes_at_once_when_hidden(clock):
+    widget = SiWidget()
+    widget.moveTo(300, 200)
+    clock.advance(widget.animation_move.interval())
+
+    assert (widget.x(), widget.y()) == (300, 200)
+    assert widget.isMoveActive() is False
+
+
+def test_paused_animation_resumes_when_shown(clock):
+    owner = QWidget()
+    owner.show()
+    ani = SiExpAnimation(owner)
+    ani.setVisibilityPolicy(SiVisibilityPolicy.Pause)
+    ani.setCurrent(0)
+    ani.setTarget(100)
+    ani.start()
+
+    clock.advance(ani.interval())
+    owner.hide()
+    clock.advance(ani.interval())
+    paused_at = float(ani.current())
+    clock.advance(ani.interval() * 10)
+
+    assert ani.isPaused()
+    assert ani.isActive() is False
+    assert float(ani.current()) == paused_at
+
+    owner.show()
+    clock.run_until_idle()
+    assert float(ani.current()) == 100
+
+
+def test_painted_color_does_not_restyle(clock):
+    label = SiLabel()
+    label.setFixedStyleSheet("border-radius: 4px")
+    label.setColorPainted(True)
+    label.setColor("#00FF3366")
+    stylesheet = label.styleSheet()
+
+    label.setColorTo("#FFFF3366")
+    clock.run_until_idle()
+
+    assert label.styleSheet() == stylesheet
+    assert label.colorFill().color.name() == "#ff3366"
+    assert label.colorFill().color.alpha() == 255
+    assert label.colorFill().radii == (4, 4, 4, 4)